@@ -2,6 +2,7 @@ import os
 import re
 import json
 import uuid
+import orjson
 import threading
 from flask import Flask, request, jsonify
 from flask_cors import CORS
@@ -39,8 +40,23 @@ load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 # Initialize OpenAI client
 client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
 
-# Store for SSE connections (meeting_id -> list of queues)
-sse_connections: dict[str, list] = {}
+# Store for SSE connections (meeting_id -> set of queues)
+sse_connections: dict[str, set] = {}
+
+# Guards sse_connections: stream threads register and unregister queues
+# while processing threads broadcast. Without it, a stream could add its
+# queue to a meeting's set just as another drops the set for being empty
+sse_connections_lock = threading.Lock()
+
+# SSE comment sent on idle connections. EventSource consumes comments
+# itself, so keepalives never reach the page's message handler
+SSE_KEEPALIVE = ": keepalive\n\n"
+
+# Sentence splitter for transcript chunking, compiled once
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# \u escapes not followed by 4 hex digits, which break json.loads on LLM output
+INVALID_UNICODE_ESCAPE = re.compile(r'\\u(?![0-9a-fA-F]{4})[0-9a-fA-F]{0,3}')
 
 
 def create_app():
@@ -295,37 +311,36 @@ def register_routes(app):
             q = Queue()
             
             # Register this connection
-            if meeting_id not in sse_connections:
-                sse_connections[meeting_id] = []
-            sse_connections[meeting_id].append(q)
+            with sse_connections_lock:
+                sse_connections.setdefault(meeting_id, set()).add(q)
             
             try:
                 # Send initial connection message
-                yield f"data: {json.dumps({'type': 'connected', 'meetingId': meeting_id})}\n\n"
+                yield sse_event({'type': 'connected', 'meetingId': meeting_id})
                 
                 # Keep connection alive and send updates
                 while True:
                     try:
-                        # Wait for updates (with timeout for keepalive)
-                        message = q.get(timeout=30)
-                        if message is None:
+                        # Wait for updates (with timeout for keepalive);
+                        # broadcasts arrive already formatted as SSE events
+                        event = q.get(timeout=30)
+                        if event is None:
                             break
-                        yield f"data: {json.dumps(message)}\n\n"
+                        yield event
                     except Empty:
                         # Send keepalive on timeout
-                        yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
+                        yield SSE_KEEPALIVE
             except GeneratorExit:
                 # Client disconnected - exit gracefully
                 pass
             finally:
                 # Cleanup
-                if meeting_id in sse_connections:
-                    try:
-                        sse_connections[meeting_id].remove(q)
-                        if not sse_connections[meeting_id]:
+                with sse_connections_lock:
+                    subscribers = sse_connections.get(meeting_id)
+                    if subscribers is not None:
+                        subscribers.discard(q)
+                        if not subscribers:
                             del sse_connections[meeting_id]
-                    except (ValueError, KeyError):
-                        pass
         
         return app.response_class(
             generate(),
@@ -581,8 +596,8 @@ def register_routes(app):
         
         # Re-index meeting notes for search
         try:
-            from search.indexer import SearchIndexer
-            indexer = SearchIndexer()
+            from search.indexer import get_search_indexer
+            indexer = get_search_indexer()
             indexer.index_meeting_notes(meeting_id, new_summary)
         except Exception as e:
             print(f"Warning: Failed to index meeting notes for {meeting_id}: {e}")
@@ -665,8 +680,8 @@ def register_routes(app):
         
         # Index the generated meeting notes for search
         try:
-            from search.indexer import SearchIndexer
-            indexer = SearchIndexer()
+            from search.indexer import get_search_indexer
+            indexer = get_search_indexer()
             indexer.index_meeting_notes(meeting_id, document)
         except Exception as e:
             print(f"Warning: Failed to index generated document for {meeting_id}: {e}")
@@ -933,8 +948,8 @@ def register_routes(app):
             return jsonify({'error': 'Meeting not found'}), 404
         
         try:
-            from search.indexer import SearchIndexer
-            indexer = SearchIndexer()
+            from search.indexer import get_search_indexer
+            indexer = get_search_indexer()
             result = indexer.reindex_meeting(meeting_id)
             return jsonify(result), 200
         except Exception as e:
@@ -1182,11 +1197,24 @@ def register_routes(app):
         return jsonify({'success': True}), 200
 
 
+def sse_event(message: dict) -> str:
+    """Format a message as one SSE data event."""
+    return f"data: {orjson.dumps(message).decode()}\n\n"
+
+
 def broadcast_to_meeting(meeting_id: str, message: dict):
-    """Broadcast a message to all SSE connections for a meeting."""
-    if meeting_id in sse_connections:
-        for q in sse_connections[meeting_id]:
-            q.put(message)
+    """
+    Broadcast a message to all SSE connections for a meeting.
+    The message is serialized once and the same event string is queued for
+    every connection, rather than each connection re-encoding it.
+    """
+    with sse_connections_lock:
+        subscribers = tuple(sse_connections.get(meeting_id, ()))
+    if subscribers:
+        event = sse_event(message)
+        # Put outside the lock, on a snapshot: streams may come and go meanwhile
+        for q in subscribers:
+            q.put(event)
 
 
 def process_transcript_chunks(meeting_id: str, chunks: list[str]):
@@ -1246,8 +1274,8 @@ def process_transcript_chunks(meeting_id: str, chunks: list[str]):
     
     # Index the meeting for search
     try:
-        from search.indexer import SearchIndexer
-        indexer = SearchIndexer()
+        from search.indexer import get_search_indexer
+        indexer = get_search_indexer()
         index_result = indexer.index_meeting_complete(meeting_id)
         print(f"Indexed meeting {meeting_id}: {index_result}")
     except Exception as e:
@@ -1261,9 +1289,10 @@ def process_transcript_chunks(meeting_id: str, chunks: list[str]):
     })
     
     # Close SSE connections for this meeting
-    if meeting_id in sse_connections:
-        for q in sse_connections[meeting_id]:
-            q.put(None)
+    with sse_connections_lock:
+        subscribers = tuple(sse_connections.get(meeting_id, ()))
+    for q in subscribers:
+        q.put(None)
 
 
 # ==================== HELPER FUNCTIONS ====================
@@ -1292,21 +1321,14 @@ def chunk_transcript(transcript: str) -> list[str]:
         List of chunks, each containing 10 sentences (or fewer for the last chunk)
     """
     # Split by sentence-ending punctuation while keeping the punctuation
-    # This regex splits on . ! or ? followed by whitespace or end of string
-    sentence_pattern = r'(?<=[.!?])\s+'
-    sentences = re.split(sentence_pattern, transcript.strip())
+    # SENTENCE_BOUNDARY splits on . ! or ? followed by whitespace
+    sentences = SENTENCE_BOUNDARY.split(transcript.strip())
     
-    # Filter out empty strings
-    sentences = [s.strip() for s in sentences if s.strip()]
-    
-    chunks = []
+    # Filter out empty strings (stripping each sentence once)
+    sentences = [stripped for s in sentences if (stripped := s.strip())]
     
     # Take 10 sentences per chunk
-    for i in range(0, len(sentences), 10):
-        chunk = ' '.join(sentences[i:i+10])
-        chunks.append(chunk)
-    
-    return chunks
+    return [' '.join(sentences[i:i + 10]) for i in range(0, len(sentences), 10)]
 
 
 def pass_chunk(chunk: str, current_state_data: CurrentStateData, chunk_index: int = 0) -> CurrentStateData:
@@ -1344,13 +1366,12 @@ def pass_chunk(chunk: str, current_state_data: CurrentStateData, chunk_index: in
         raw_content = response.choices[0].message.content
         
         # Try to parse JSON, fixing common LLM issues if needed
-        import re
         try:
             result = json.loads(raw_content)
         except json.JSONDecodeError as e:
             # Fix invalid unicode escapes (e.g., \uXXXX where XXXX isn't valid hex)
             # Remove any \u that isn't followed by exactly 4 hex digits
-            fixed_content = re.sub(r'\\u(?![0-9a-fA-F]{4})[0-9a-fA-F]{0,3}', '', raw_content)
+            fixed_content = INVALID_UNICODE_ESCAPE.sub('', raw_content)
             result = json.loads(fixed_content)
         
         # Parse workflows into Workflow models with nodes/edges
@@ -0,0 +1,37 @@
+"""
+Sentence-based transcript chunking, shared by the search indexer and the seeder.
+
+Kept free of third-party imports so callers that only need chunk counts
+(seed_db.py) don't load the OpenAI client or FAISS.
+"""
+import re
+
+# Sentence splitter for transcript chunking, compiled once for all meetings
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
+def chunk_transcript(transcript: str, sentences_per_chunk: int = 10) -> list[str]:
+    """
+    Break a transcript into chunks.
+    
+    Uses the same chunking logic as the main processing pipeline.
+    
+    Args:
+        transcript: Full transcript text
+        sentences_per_chunk: Number of sentences per chunk
+        
+    Returns:
+        List of chunk strings
+    """
+    # Split by sentence-ending punctuation
+    sentences = SENTENCE_BOUNDARY.split(transcript.strip())
+    
+    # Filter empty strings
+    sentences = [s.strip() for s in sentences if s.strip()]
+    
+    chunks = []
+    for i in range(0, len(sentences), sentences_per_chunk):
+        chunk = ' '.join(sentences[i:i + sentences_per_chunk])
+        chunks.append(chunk)
+    
+    return chunks
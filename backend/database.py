@@ -7,21 +7,38 @@ import os
 from contextlib import contextmanager
 from typing import Optional
 
+import orjson
+
 from models import Meeting, CurrentStateVersion
 from models.meeting_schema import Status
 from models.currentStateVersion_schema import Data as CurrentStateData
 from models.workflow_schema import Model as Workflow, Node, Edge, Type as NodeType, Variant as NodeVariant
 
 
-# Database file path (in data directory, committed to git)
+# Database file path (in data directory, committed to git). BLUEPRINT_DB_PATH
+# overrides it; ":memory:" keeps the whole database in memory for this process.
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
 os.makedirs(DATA_DIR, exist_ok=True)
-DB_PATH = os.path.join(DATA_DIR, 'blueprint.db')
+DB_PATH = os.environ.get('BLUEPRINT_DB_PATH') or os.path.join(DATA_DIR, 'blueprint.db')
+IN_MEMORY = DB_PATH == ':memory:'
+
+# Every connection opens a fresh database for a plain ":memory:" path, so the
+# in-memory mode uses one named shared-cache database instead. It lives as long
+# as at least one connection to it is open, hence the anchor connection.
+_MEMORY_URI = 'file:blueprint?mode=memory&cache=shared'
+_memory_anchor = sqlite3.connect(_MEMORY_URI, uri=True) if IN_MEMORY else None
+
+
+def connect(**kwargs) -> sqlite3.Connection:
+    """Open a raw connection to the database, honouring the in-memory mode."""
+    if IN_MEMORY:
+        return sqlite3.connect(_MEMORY_URI, uri=True, **kwargs)
+    return sqlite3.connect(DB_PATH, **kwargs)
 
 
 def get_connection() -> sqlite3.Connection:
     """Get a database connection."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect()
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -40,6 +57,16 @@ def get_db():
         conn.close()
 
 
+@contextmanager
+def _use_db(conn: Optional[sqlite3.Connection] = None):
+    """Yield conn if given (its owner handles the transaction), else a get_db() connection."""
+    if conn is not None:
+        yield conn
+    else:
+        with get_db() as conn:
+            yield conn
+
+
 def init_db():
     """Initialize the database schema."""
     with get_db() as conn:
@@ -155,9 +182,9 @@ def _migrate_add_chat_session_meeting_id(cursor):
 
 # ==================== MEETING OPERATIONS ====================
 
-def create_meeting(meeting: Meeting) -> None:
-    """Store a new meeting in the database."""
-    with get_db() as conn:
+def create_meeting(meeting: Meeting, conn: Optional[sqlite3.Connection] = None) -> None:
+    """Store a new meeting in the database, on conn if given."""
+    with _use_db(conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             '''INSERT INTO meetings (meeting_id, status, org_id, title, transcript, total_chunks) 
@@ -173,6 +200,38 @@ def create_meeting(meeting: Meeting) -> None:
         )
 
 
+def meeting_row(meeting: Meeting) -> tuple:
+    """Build the meetings-table row for a meeting, in column order."""
+    return (
+        meeting.meetingId,
+        meeting.status.value,
+        meeting.orgId,
+        meeting.title,
+        meeting.transcript,
+        meeting.totalChunks
+    )
+
+
+def create_meetings(meetings: list[Meeting], conn: Optional[sqlite3.Connection] = None) -> None:
+    """Store many new meetings in a single transaction, on conn if given."""
+    with _use_db(conn) as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            '''INSERT INTO meetings (meeting_id, status, org_id, title, transcript, total_chunks) 
+               VALUES (?, ?, ?, ?, ?, ?)''',
+            [meeting_row(meeting) for meeting in meetings]
+        )
+
+
+def delete_meetings(meeting_ids: list[str], conn: Optional[sqlite3.Connection] = None) -> None:
+    """Delete many meetings and their state versions in a single transaction, on conn if given."""
+    with _use_db(conn) as conn:
+        cursor = conn.cursor()
+        for batch, placeholders in _id_batches(meeting_ids):
+            cursor.execute(f'DELETE FROM state_versions WHERE meeting_id IN ({placeholders})', batch)
+            cursor.execute(f'DELETE FROM meetings WHERE meeting_id IN ({placeholders})', batch)
+
+
 def get_meeting(meeting_id: str) -> Optional[Meeting]:
     """Retrieve a meeting by ID."""
     with get_db() as conn:
@@ -196,6 +255,40 @@ def get_meeting(meeting_id: str) -> Optional[Meeting]:
         )
 
 
+# Stay well under SQLite's bound-parameter limit for IN (...) lookups
+_IN_CLAUSE_BATCH_SIZE = 500
+
+
+def _id_batches(ids: list[str]):
+    """Yield (batch, placeholders) pairs for IN (...) queries over ids."""
+    for start in range(0, len(ids), _IN_CLAUSE_BATCH_SIZE):
+        batch = ids[start:start + _IN_CLAUSE_BATCH_SIZE]
+        yield batch, ', '.join('?' * len(batch))
+
+
+def get_meetings(meeting_ids: list[str]) -> list[Meeting]:
+    """Retrieve many meetings by ID with IN (...) queries, in the order given. Missing IDs are skipped."""
+    by_id = {}
+    with get_db() as conn:
+        cursor = conn.cursor()
+        for batch, placeholders in _id_batches(meeting_ids):
+            cursor.execute(
+                f'SELECT meeting_id, status, org_id, title, transcript, total_chunks FROM meetings WHERE meeting_id IN ({placeholders})',
+                batch
+            )
+            for row in cursor.fetchall():
+                by_id[row['meeting_id']] = Meeting(
+                    meetingId=row['meeting_id'],
+                    status=Status(row['status']),
+                    orgId=row['org_id'],
+                    title=row['title'],
+                    transcript=row['transcript'],
+                    totalChunks=row['total_chunks']
+                )
+    
+    return [by_id[meeting_id] for meeting_id in meeting_ids if meeting_id in by_id]
+
+
 def update_meeting_status(meeting_id: str, status: Status) -> bool:
     """Update a meeting's status."""
     with get_db() as conn:
@@ -267,12 +360,12 @@ def get_meetings_by_org(org_id: str) -> list[Meeting]:
 
 def _serialize_state_data(data: CurrentStateData) -> str:
     """Serialize CurrentStateData to JSON string."""
-    return json.dumps(data.model_dump(mode='json'))
+    return orjson.dumps(data.model_dump(mode='json')).decode()
 
 
 def _deserialize_state_data(json_str: str) -> CurrentStateData:
     """Deserialize JSON string to CurrentStateData."""
-    data_dict = json.loads(json_str)
+    data_dict = orjson.loads(json_str)
     
     # Reconstruct workflows
     workflows = []
@@ -333,6 +426,58 @@ def add_state_version(meeting_id: str, state_version: CurrentStateVersion) -> No
         )
 
 
+def state_version_row(meeting_id: str, state_version: CurrentStateVersion) -> tuple:
+    """Build the state_versions-table row for a state version, in column order."""
+    return (
+        meeting_id,
+        state_version.version,
+        state_version.currentStateId,
+        _serialize_state_data(state_version.data)
+    )
+
+
+def _serialize_state_data_shared(data: CurrentStateData, dumped_workflows: dict[int, list]) -> str:
+    """
+    Serialize CurrentStateData like _serialize_state_data, dumping each
+    workflows list only once.
+    
+    dumped_workflows maps id(workflows list) -> its model_dump, and is filled
+    in as new lists are seen, so versions that share one list (e.g. every
+    chunk version of a seeded meeting) reuse the same dump.
+    """
+    key = id(data.workflows)
+    workflows = dumped_workflows.get(key)
+    if workflows is None:
+        workflows = dumped_workflows[key] = [w.model_dump(mode='json') for w in data.workflows]
+    
+    dumped = data.model_dump(mode='json', exclude={'workflows'})
+    return orjson.dumps({
+        field: workflows if field == 'workflows' else dumped[field]
+        for field in type(data).model_fields
+    }).decode()
+
+
+def add_state_versions(
+    state_versions: list[tuple[str, CurrentStateVersion]],
+    conn: Optional[sqlite3.Connection] = None
+) -> None:
+    """Add many (meeting_id, state_version) pairs in a single transaction, on conn if given."""
+    # Versions often share one workflows list; serialize each list once
+    dumped_workflows: dict[int, list] = {}
+    rows = [
+        (meeting_id, sv.version, sv.currentStateId, _serialize_state_data_shared(sv.data, dumped_workflows))
+        for meeting_id, sv in state_versions
+    ]
+    with _use_db(conn) as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            '''INSERT INTO state_versions 
+               (meeting_id, version, current_state_id, data_json) 
+               VALUES (?, ?, ?, ?)''',
+            rows
+        )
+
+
 def get_all_state_versions(meeting_id: str) -> list[CurrentStateVersion]:
     """Get all state versions for a meeting, ordered by version."""
     with get_db() as conn:
@@ -382,6 +527,33 @@ def get_latest_state_version(meeting_id: str) -> Optional[CurrentStateVersion]:
         )
 
 
+def get_latest_state_versions(meeting_ids: list[str]) -> dict[str, CurrentStateVersion]:
+    """Get the latest state version for many meetings at once, keyed by meeting ID."""
+    latest = {}
+    with get_db() as conn:
+        cursor = conn.cursor()
+        for batch, placeholders in _id_batches(meeting_ids):
+            cursor.execute(
+                f'''SELECT sv.meeting_id, sv.version, sv.current_state_id, sv.data_json 
+                   FROM state_versions sv
+                   JOIN (
+                       SELECT meeting_id, MAX(version) AS version 
+                       FROM state_versions 
+                       WHERE meeting_id IN ({placeholders}) 
+                       GROUP BY meeting_id
+                   ) newest ON sv.meeting_id = newest.meeting_id AND sv.version = newest.version''',
+                batch
+            )
+            for row in cursor.fetchall():
+                latest[row['meeting_id']] = CurrentStateVersion(
+                    version=row['version'],
+                    currentStateId=row['current_state_id'],
+                    data=_deserialize_state_data(row['data_json'])
+                )
+    
+    return latest
+
+
 def get_state_version(meeting_id: str, version: int) -> Optional[CurrentStateVersion]:
     """Get a specific state version for a meeting."""
     with get_db() as conn:
@@ -9,6 +9,7 @@ Provides a singleton service for generating embeddings with:
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -22,6 +23,8 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 1536
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0  # seconds
+BATCH_SIZE = 100
+BATCH_WORKERS = 4  # Concurrent embedding requests in embed_batch
 
 
 class EmbeddingService:
@@ -125,35 +128,20 @@ class EmbeddingService:
         if not valid_texts:
             return [[] for _ in texts]
         
-        # Batch process
-        batch_size = 100
-        all_embeddings = {}
+        # Batch process; requests are network-bound, so independent batches
+        # are sent concurrently
+        batches = [
+            valid_texts[batch_start:batch_start + BATCH_SIZE]
+            for batch_start in range(0, len(valid_texts), BATCH_SIZE)
+        ]
+        if len(batches) == 1:
+            batch_results = [self._embed_request(batches[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(batches))) as executor:
+                batch_results = list(executor.map(self._embed_request, batches))
         
-        for batch_start in range(0, len(valid_texts), batch_size):
-            batch_end = min(batch_start + batch_size, len(valid_texts))
-            batch_texts = valid_texts[batch_start:batch_end]
-            batch_indices = valid_indices[batch_start:batch_end]
-            
-            last_error = None
-            for attempt in range(MAX_RETRIES):
-                try:
-                    response = self._client.embeddings.create(
-                        input=batch_texts,
-                        model=EMBEDDING_MODEL
-                    )
-                    
-                    # Map embeddings back to original indices
-                    for j, embedding_data in enumerate(response.data):
-                        original_idx = batch_indices[j]
-                        all_embeddings[original_idx] = embedding_data.embedding
-                    
-                    break
-                except Exception as e:
-                    last_error = e
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                raise Exception(f"Failed to generate batch embeddings after {MAX_RETRIES} attempts: {last_error}")
+        # Map embeddings back to original indices
+        all_embeddings = dict(zip(valid_indices, (e for batch in batch_results for e in batch)))
         
         # Reconstruct full list with empty embeddings for invalid texts
         result = []
@@ -164,6 +152,28 @@ class EmbeddingService:
                 result.append([])
         
         return result
+    
+    def _embed_request(self, batch_texts: list[str]) -> list[list[float]]:
+        """
+        Embed one batch of texts in a single API request, with retries.
+        
+        Raises:
+            Exception: If embedding fails after retries
+        """
+        last_error = None
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = self._client.embeddings.create(
+                    input=batch_texts,
+                    model=EMBEDDING_MODEL
+                )
+                return [embedding_data.embedding for embedding_data in response.data]
+            except Exception as e:
+                last_error = e
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(RETRY_DELAY * (attempt + 1))
+        
+        raise Exception(f"Failed to generate batch embeddings after {MAX_RETRIES} attempts: {last_error}")
 
 
 # Convenience function for simple usage
@@ -11,17 +11,23 @@ Handles indexing of:
 import os
 import json
 import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Optional
 from openai import OpenAI
 from dotenv import load_dotenv
 from pathlib import Path
 
+from chunking import chunk_transcript
 from .embeddings import EmbeddingService
 from .vector_store import VectorStore, Document, DocType
 
 # Load .env
 load_dotenv(Path(__file__).resolve().parent.parent.parent / ".env")
 
+# Concurrent workflow-summary LLM calls during bulk indexing
+SUMMARY_WORKERS = 8
 
 class SearchIndexer:
     """
@@ -91,6 +97,111 @@ class SearchIndexer:
         
         return results
     
+    def index_meetings_bulk(self, meeting_ids: list[str]) -> dict[str, dict]:
+        """
+        Index many meetings at once.
+        
+        Indexes the same documents as index_meeting_complete(), but reads all
+        meetings and states with bulk queries, generates workflow summaries
+        concurrently, embeds every text in one embed_batch() call and writes
+        each index with a single add_documents() call.
+        
+        Args:
+            meeting_ids: The meetings to index
+            
+        Returns:
+            Dict of meeting_id -> results dict (same shape as index_meeting_complete)
+        """
+        import sys
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        import database as db
+        
+        meetings = db.get_meetings(meeting_ids)
+        states = db.get_latest_state_versions(meeting_ids)
+        
+        results = {meeting_id: {"error": "Meeting not found"} for meeting_id in meeting_ids}
+        documents: dict[DocType, list[Document]] = {
+            "meeting_title": [],
+            "transcript_chunk": [],
+            "workflow_summary": [],
+        }
+        pending_workflows = []  # (meeting_id, org_id, workflow dict)
+        
+        for meeting in meetings:
+            meeting_id = meeting.meetingId
+            state = states.get(meeting_id)
+            if not state:
+                results[meeting_id] = {"error": "No state found for meeting"}
+                continue
+            
+            result = {
+                "meeting_id": meeting_id,
+                "title_indexed": False,
+                "chunks_indexed": 0,
+                "workflows_indexed": 0,
+            }
+            
+            if meeting.title:
+                documents["meeting_title"].append(Document(
+                    id=f"title-{meeting_id}",
+                    org_id=meeting.orgId,
+                    meeting_id=meeting_id,
+                    text=meeting.title,
+                    source_id=None
+                ))
+                result["title_indexed"] = True
+            
+            if meeting.transcript:
+                chunks = self._chunk_transcript(meeting.transcript)
+                documents["transcript_chunk"].extend(
+                    Document(
+                        id=f"chunk-{meeting_id}-{i}",
+                        org_id=meeting.orgId,
+                        meeting_id=meeting_id,
+                        text=chunk,
+                        source_id=str(i)
+                    )
+                    for i, chunk in enumerate(chunks)
+                )
+                result["chunks_indexed"] = len(chunks)
+            
+            for wf in state.data.workflows or []:
+                wf_dict = wf.model_dump(mode='json') if hasattr(wf, 'model_dump') else wf
+                pending_workflows.append((meeting_id, meeting.orgId, wf_dict))
+            result["workflows_indexed"] = len(state.data.workflows or [])
+            
+            results[meeting_id] = result
+        
+        # Workflow summaries are independent LLM calls, so overlap them
+        if pending_workflows:
+            with ThreadPoolExecutor(max_workers=min(SUMMARY_WORKERS, len(pending_workflows))) as executor:
+                summaries = list(executor.map(
+                    self._generate_workflow_summary,
+                    [wf_dict for _, _, wf_dict in pending_workflows]
+                ))
+            documents["workflow_summary"] = [
+                Document(
+                    id=f"workflow-{wf_dict['id']}",
+                    org_id=org_id,
+                    meeting_id=meeting_id,
+                    text=summary,
+                    source_id=wf_dict['id']
+                )
+                for (meeting_id, org_id, wf_dict), summary in zip(pending_workflows, summaries)
+            ]
+        
+        # One embedding pass over every document, then one write per index
+        all_docs = [doc for docs in documents.values() for doc in docs]
+        embeddings = self._embedding_service.embed_batch([doc.text for doc in all_docs])
+        
+        offset = 0
+        for doc_type, docs in documents.items():
+            if docs:
+                self._vector_store.add_documents(doc_type, docs, embeddings[offset:offset + len(docs)])
+            offset += len(docs)
+        
+        return results
+    
     def index_meeting_notes(self, meeting_id: str, notes: str) -> bool:
         """
         Index meeting notes when generated via sparkle button.
@@ -164,6 +275,22 @@ class SearchIndexer:
         # Reindex
         return self.index_meeting_complete(meeting_id)
     
+    @contextmanager
+    def bulk_session(self):
+        """
+        Group many index calls into one vector store write session.
+        
+        Everything indexed inside the block is committed to the metadata
+        database, and each touched FAISS index saved to disk, once on exit.
+        
+        Usage:
+            with indexer.bulk_session():
+                for meeting_id in meeting_ids:
+                    indexer.index_meeting_complete(meeting_id)
+        """
+        with self._vector_store.bulk_session():
+            yield self
+    
     def _index_title(self, meeting_id: str, org_id: str, title: str):
         """Index a meeting title."""
         doc = Document(
@@ -285,36 +412,20 @@ Write a concise summary that would help someone understand what this workflow is
             return f"{title}: {', '.join(node_labels[:5])}"
     
     def _chunk_transcript(self, transcript: str, sentences_per_chunk: int = 10) -> list[str]:
-        """
-        Break a transcript into chunks.
-        
-        Uses the same chunking logic as the main processing pipeline.
-        
-        Args:
-            transcript: Full transcript text
-            sentences_per_chunk: Number of sentences per chunk
-            
-        Returns:
-            List of chunk strings
-        """
-        import re
-        
-        # Split by sentence-ending punctuation
-        sentence_pattern = r'(?<=[.!?])\s+'
-        sentences = re.split(sentence_pattern, transcript.strip())
-        
-        # Filter empty strings
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        chunks = []
-        for i in range(0, len(sentences), sentences_per_chunk):
-            chunk = ' '.join(sentences[i:i + sentences_per_chunk])
-            chunks.append(chunk)
-        
-        return chunks
+        """Break a transcript into chunks (see chunk_transcript)."""
+        return chunk_transcript(transcript, sentences_per_chunk)
+
+
+# Singleton instance, shared so its OpenAI client and connection pool are reused
+_search_indexer: Optional[SearchIndexer] = None
+_search_indexer_lock = threading.Lock()
 
 
-# Convenience function
 def get_search_indexer() -> SearchIndexer:
-    """Get a search indexer instance."""
-    return SearchIndexer()
+    """Get the singleton search indexer instance."""
+    global _search_indexer
+    if _search_indexer is None:
+        with _search_indexer_lock:
+            if _search_indexer is None:
+                _search_indexer = SearchIndexer()
+    return _search_indexer
@@ -13,6 +13,7 @@ Metadata is stored in SQLite alongside the vectors.
 import os
 import json
 import sqlite3
+import threading
 import numpy as np
 from dataclasses import dataclass, asdict
 from typing import Optional, Literal
@@ -89,6 +90,14 @@ class VectorStore:
         self._indices: dict[DocType, faiss.IndexFlatIP] = {}
         self._load_indices()
         
+        # Serializes writers: a document's faiss_idx is derived from the
+        # index size, so concurrent adds must not interleave
+        self._write_lock = threading.RLock()
+        
+        # Set while a bulk_session() is open
+        self._bulk_conn: Optional[sqlite3.Connection] = None
+        self._dirty_indices: set[DocType] = set()
+        
         self._initialized = True
     
     def _init_db(self):
@@ -125,16 +134,70 @@ class VectorStore:
         finally:
             conn.close()
     
+    @contextmanager
+    def _write_db(self):
+        """Get the connection for metadata writes: the bulk session's if one is open."""
+        if self._bulk_conn is not None:
+            yield self._bulk_conn
+        else:
+            with self._get_db() as conn:
+                yield conn
+    
+    @contextmanager
+    def bulk_session(self):
+        """
+        Batch many writes into one commit.
+        
+        While the session is open, metadata writes share a single connection
+        that is committed on exit, and each FAISS index that was added to is
+        written to disk once on exit instead of after every add_documents().
+        If the session fails, the metadata is rolled back and those indices
+        are reloaded from disk, dropping the vectors added during it.
+        Nested sessions join the outer one.
+        """
+        if self._bulk_conn is not None:
+            yield self
+            return
+        
+        with self._write_lock:
+            conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._bulk_conn = conn
+        
+        try:
+            yield self
+            with self._write_lock:
+                conn.commit()
+                for doc_type in self._dirty_indices:
+                    self._save_index(doc_type)
+        except Exception:
+            with self._write_lock:
+                conn.rollback()
+                # The rolled-back metadata no longer points at the vectors
+                # added in this session, so go back to the saved indices
+                for doc_type in self._dirty_indices:
+                    self._load_index(doc_type)
+            raise
+        finally:
+            with self._write_lock:
+                self._bulk_conn = None
+                conn.close()
+                self._dirty_indices.clear()
+    
     def _load_indices(self):
         """Load existing indices from disk or create new ones."""
         for doc_type in DOC_TYPES:
-            index_path = DATA_DIR / f"{doc_type}.index"
-            
-            if index_path.exists():
-                self._indices[doc_type] = faiss.read_index(str(index_path))
-            else:
-                # Create new index using Inner Product (for cosine similarity with normalized vectors)
-                self._indices[doc_type] = faiss.IndexFlatIP(EMBEDDING_DIMENSIONS)
+            self._load_index(doc_type)
+    
+    def _load_index(self, doc_type: DocType):
+        """Load a specific index from disk, or create a new one if none is saved."""
+        index_path = DATA_DIR / f"{doc_type}.index"
+        
+        if index_path.exists():
+            self._indices[doc_type] = faiss.read_index(str(index_path))
+        else:
+            # Create new index using Inner Product (for cosine similarity with normalized vectors)
+            self._indices[doc_type] = faiss.IndexFlatIP(EMBEDDING_DIMENSIONS)
     
     def _save_index(self, doc_type: DocType):
         """Save a specific index to disk."""
@@ -185,28 +248,32 @@ class VectorStore:
         vectors = np.array(valid_embeddings, dtype=np.float32)
         vectors = self._normalize(vectors)
         
-        # Get current index size (this will be the starting faiss_idx for new docs)
-        index = self._indices[doc_type]
-        start_idx = index.ntotal
-        
-        # Add to FAISS
-        index.add(vectors)
-        
-        # Add metadata to SQLite
-        added_ids = []
-        with self._get_db() as conn:
-            cursor = conn.cursor()
-            for i, doc in enumerate(valid_docs):
-                faiss_idx = start_idx + i
-                cursor.execute('''
-                    INSERT OR REPLACE INTO search_documents 
-                    (id, doc_type, org_id, meeting_id, source_id, text, faiss_idx)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (doc.id, doc_type, doc.org_id, doc.meeting_id, doc.source_id, doc.text, faiss_idx))
-                added_ids.append(doc.id)
-        
-        # Persist index
-        self._save_index(doc_type)
+        with self._write_lock:
+            # Get current index size (this will be the starting faiss_idx for new docs)
+            index = self._indices[doc_type]
+            start_idx = index.ntotal
+            
+            # Add to FAISS
+            index.add(vectors)
+            
+            # Add metadata to SQLite
+            added_ids = []
+            with self._write_db() as conn:
+                cursor = conn.cursor()
+                for i, doc in enumerate(valid_docs):
+                    faiss_idx = start_idx + i
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO search_documents 
+                        (id, doc_type, org_id, meeting_id, source_id, text, faiss_idx)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', (doc.id, doc_type, doc.org_id, doc.meeting_id, doc.source_id, doc.text, faiss_idx))
+                    added_ids.append(doc.id)
+            
+            # Persist index (deferred to the end of a bulk session)
+            if self._bulk_conn is not None:
+                self._dirty_indices.add(doc_type)
+            else:
+                self._save_index(doc_type)
         
         return added_ids
     
@@ -297,7 +364,7 @@ class VectorStore:
         """
         deleted = {}
         
-        with self._get_db() as conn:
+        with self._write_lock, self._write_db() as conn:
             cursor = conn.cursor()
             
             for doc_type in DOC_TYPES:
@@ -21,28 +21,36 @@ import sys
 import uuid
 import time
 import random
+import re
+import asyncio
+import heapq
+import hashlib
+import shutil
+import sqlite3
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime, timedelta
 
 # Add backend to path
 backend_path = Path(__file__).parent
 sys.path.insert(0, str(backend_path))
 
+import httpx
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
 
 from database import (
-    DB_PATH, init_db, create_meeting, add_state_version, 
-    get_db, update_meeting_status, get_meeting
+    DB_PATH, init_db, connect, create_meetings, add_state_versions, 
+    get_db, update_meeting_status, get_meetings, get_meetings_by_org,
+    get_latest_state_versions, delete_meetings
 )
 from models import Meeting, CurrentStateVersion
 from models.meeting_schema import Status
 from models.currentStateVersion_schema import Data as CurrentStateData
-from models.workflow_schema import (
-    Model as Workflow, Node, Edge, 
-    Type as NodeType, Variant as NodeVariant
-)
+from models.workflow_schema import Model as Workflow
 
 # Load environment
 load_dotenv(backend_path.parent / ".env")
@@ -50,32 +58,82 @@ load_dotenv(backend_path.parent / ".env")
 # All meetings belong to the same eval org
 EVAL_ORG_ID = "eval-org"
 
+# Local copy of the MeetingBank test split, written on first load
+MEETINGBANK_CACHE_DIR = backend_path / "data" / "hf_cache" / "meetingbank_test"
+
+# Meetings processed at the same time (each makes 3 LLM calls)
+LLM_CONCURRENCY = 8
+
+# Retries per LLM call on 429s, 5xx and connection errors. The SDK backs off
+# exponentially and honours Retry-After, which concurrent runs rely on.
+LLM_MAX_RETRIES = 6
+
+# LLM responses keyed by request body, so re-seeding skips repeat calls
+LLM_CACHE_PATH = backend_path / "data" / "llm_cache.sqlite"
+
+
+# City for each MeetingBank UID prefix (the part before the first underscore)
+CITY_PREFIX = {
+    "SeattleCityCouncil": "seattle",
+    "BostonCC": "boston",
+    "DenverCityCouncil": "denver",
+    "AlamedaCC": "alameda",
+    "LongBeachCC": "long_beach",
+    "KingCountyCC": "king_county",
+}
+
+# Fallback for unknown prefixes; each group name is the city label
+CITY_RE = re.compile(
+    r'(?P<seattle>Seattle)|(?P<boston>Boston)|(?P<denver>Denver)|(?P<alameda>Alameda)'
+    r'|(?P<long_beach>LongBeach|Long Beach)|(?P<king_county>KingCounty|King County)'
+)
+
+
+def emit(lines: List[str]):
+    """Write a block of progress lines to stdout with a single write call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
 
 def load_meetingbank_meetings(n: int = 50, seed: int = 42) -> List[Dict[str, Any]]:
     """Load n meetings from MeetingBank test set."""
     print(f"\n📚 Loading {n} meetings from MeetingBank...")
     
+    # Once the test split has been saved locally, load it from disk with the
+    # Hub disabled; this must be set before datasets is imported
+    cached = MEETINGBANK_CACHE_DIR.exists()
+    if cached:
+        os.environ["HF_DATASETS_OFFLINE"] = "1"
+    
     try:
-        from datasets import load_dataset
+        from datasets import load_dataset, load_from_disk
+        import pyarrow.compute as pc
     except ImportError:
         print("❌ Error: 'datasets' library not installed")
         print("   Run: pip install datasets")
         sys.exit(1)
     
-    # Load test set (cleaner, better for evals)
-    dataset = load_dataset("huuuyeah/meetingbank", split="test")
-    
-    # Sort by transcript length (descending) and take top n
-    print(f"   Sorting by transcript length...")
-    meetings_with_length = [(i, dataset[i], len(dataset[i]['transcript'])) for i in range(len(dataset))]
-    meetings_with_length.sort(key=lambda x: x[2], reverse=True)
-    
-    # Take top n longest transcripts
-    selected = meetings_with_length[:n]
-    meetings = [m[1] for m in selected]
+    # Test set (cleaner, better for evals)
+    if cached:
+        print(f"   Using local copy at {MEETINGBANK_CACHE_DIR}")
+        dataset = load_from_disk(str(MEETINGBANK_CACHE_DIR))
+    else:
+        dataset = load_dataset("huuuyeah/meetingbank", split="test")
+        dataset.save_to_disk(str(MEETINGBANK_CACHE_DIR))
+        print(f"   Saved local copy to {MEETINGBANK_CACHE_DIR}")
+    
+    # Rank rows by transcript length on the Arrow column, then materialize
+    # only the n winners with select() instead of a Python dict per row.
+    # nlargest is stable, so ties go to the earlier row.
+    print(f"   Selecting longest transcripts...")
+    transcripts = dataset.with_format("arrow")["transcript"]
+    lengths = pc.utf8_length(transcripts).to_pylist()
+    indices = heapq.nlargest(n, range(len(lengths)), key=lengths.__getitem__)
+    meetings = list(dataset.select(indices))
     
     print(f"   Selected {n} meetings with longest transcripts")
-    print(f"   Transcript lengths: {[m[2] for m in selected[:5]]}... (showing first 5)")
+    print(f"   Transcript lengths: {[lengths[i] for i in indices[:5]]}... (showing first 5)")
     
     print(f"   ✅ Loaded {len(meetings)} meetings")
     
@@ -83,161 +141,90 @@ def load_meetingbank_meetings(n: int = 50, seed: int = 42) -> List[Dict[str, Any
     for meeting in meetings:
         # UIDs are like "SeattleCityCouncil_06132016_Res 31669"
         uid = meeting['uid']
-        city = None
-        
-        # Extract city from UID
-        if 'Seattle' in uid:
-            city = 'seattle'
-        elif 'Boston' in uid:
-            city = 'boston'
-        elif 'Denver' in uid:
-            city = 'denver'
-        elif 'Alameda' in uid:
-            city = 'alameda'
-        elif 'LongBeach' in uid or 'Long Beach' in uid:
-            city = 'long_beach'
-        elif 'KingCounty' in uid or 'King County' in uid:
-            city = 'king_county'
-        else:
+        prefix = uid.split('_', 1)[0]
+        city = CITY_PREFIX.get(prefix)
+        if city is None:
+            match = CITY_RE.search(uid)
             # Default to first word before underscore/space
-            city = uid.split('_')[0].split(' ')[0].lower()
+            city = match.lastgroup if match else prefix.split(' ', 1)[0].lower()
         
         meeting['city'] = city
         meeting['org_id'] = EVAL_ORG_ID  # All meetings in same org for eval
     
     # Show distribution
-    city_counts = {}
-    for m in meetings:
-        city_counts[m['city']] = city_counts.get(m['city'], 0) + 1
+    city_counts = Counter(m['city'] for m in meetings)
     
-    print("\n   Distribution by city:")
-    for city, count in sorted(city_counts.items()):
-        print(f"   - {city}: {count} meetings")
+    emit(["\n   Distribution by city:"] + [
+        f"   - {city}: {count} meetings" for city, count in sorted(city_counts.items())
+    ])
     
     return meetings
 
 
+# Sentence boundary for chunking: ". ", with a newline counting as a space
+SENTENCE_END = re.compile(r'\.[ \n]')
+
+
 def chunk_transcript(transcript: str, chunk_size: int = 2000) -> List[str]:
-    """Chunk transcript into smaller pieces."""
-    # Simple chunking by sentences (split on periods + space)
-    sentences = transcript.replace('\n', ' ').split('. ')
+    """
+    Chunk transcript into smaller pieces.
     
-    chunks = []
-    current_chunk = ""
+    Sentences (split on periods + space) are packed greedily into chunks of
+    under chunk_size characters. The split runs in C and the packing loop
+    only looks at sentence lengths; each chunk is joined once at the end,
+    and only chunks (not a whole-transcript copy) get newlines replaced.
+    """
+    sentences = SENTENCE_END.split(transcript)
     
-    for sentence in sentences:
-        if len(current_chunk) + len(sentence) < chunk_size:
-            current_chunk += sentence + ". "
-        else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence + ". "
+    def join(sentences: List[str]) -> str:
+        return ('. '.join(sentences) + '.').replace('\n', ' ').strip()
     
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    chunks = []
+    first = 0
+    # A chunk's size counts a ". " after each of its sentences
+    size = len(sentences[0]) + 2
+    for i, length in enumerate(map(len, sentences[1:]), 1):
+        if size + length < chunk_size:
+            size += length + 2
+        else:
+            chunks.append(join(sentences[first:i]))
+            first, size = i, length + 2
+    chunks.append(join(sentences[first:]))
     
     return chunks
 
 
-def generate_workflows_from_transcript(
-    transcript: str, 
-    title: str,
-    client: OpenAI
-) -> List[Dict[str, Any]]:
+def truncate_transcript(transcript: str, max_chars: int = 50000) -> str:
     """
-    Generate workflows from transcript using LLM.
-    Returns list of workflow dicts with nodes/edges.
-    """
-    print(f"      Generating workflows...")
+    Truncate a transcript to fit the LLM context, marking the cut.
     
-    # Truncate transcript if too long (GPT context limits)
-    max_chars = 50000
+    Built once per meeting and shared by its workflow and summary prompts.
+    """
     transcript_truncated = transcript[:max_chars]
     if len(transcript) > max_chars:
         transcript_truncated += "\n... [transcript truncated]"
-    
-    prompt = f"""Analyze this meeting transcript and extract 1-3 workflows or processes that were discussed.
-
-Meeting Title: {title}
-
-Transcript:
-{transcript_truncated}
-
-For each workflow/process, provide:
-1. A descriptive title
-2. Nodes representing steps (each with: id, type, label, optional variant)
-3. Edges connecting the nodes (each with: id, source, target, optional label)
-
-Node types: "process", "decision", "terminal"
-Terminal variants: "start", "end"
-
-Return a JSON array of workflows:
-[
-  {{
-    "title": "Workflow Title",
-    "nodes": [
-      {{"id": "n1", "type": "terminal", "label": "Start", "variant": "start"}},
-      {{"id": "n2", "type": "process", "label": "Step description"}},
-      {{"id": "n3", "type": "decision", "label": "Decision point?"}},
-      {{"id": "n4", "type": "terminal", "label": "End", "variant": "end"}}
-    ],
-    "edges": [
-      {{"id": "e1", "source": "n1", "target": "n2"}},
-      {{"id": "e2", "source": "n2", "target": "n3"}},
-      {{"id": "e3", "source": "n3", "target": "n4", "label": "Yes"}}
-    ]
-  }}
-]
+    return transcript_truncated
 
-Focus on clear, actionable workflows. Limit to 3 workflows max."""
 
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are an expert at analyzing meeting transcripts and extracting structured workflows."},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.3,
-        )
-        
-        import json
-        result = json.loads(response.choices[0].message.content)
-        
-        # Handle both array and object responses
-        workflows = result if isinstance(result, list) else result.get('workflows', [])
-        
-        print(f"         ✅ Generated {len(workflows)} workflows")
-        return workflows
-        
-    except Exception as e:
-        print(f"         ⚠️  Workflow generation failed: {e}")
-        return []
+# Request builders: each returns the chat.completions.create() body for one
+# prompt, shared by the interactive (async) path and the Batch API path.
+# Instructions live in fixed system prompts and the user message carries only
+# the per-meeting content, so every request of a kind shares a byte-identical
+# prefix that OpenAI's automatic prompt caching can reuse.
 
+WORKFLOWS_SYSTEM_PROMPT = """You are an expert at analyzing meeting transcripts and extracting structured workflows.
 
-def generate_meeting_summary(
-    transcript: str, 
-    title: str,
-    client: OpenAI
-) -> str:
-    """Generate comprehensive meeting notes from transcript."""
-    print(f"      Generating meeting notes...")
-    
-    # Truncate if needed
-    max_chars = 50000
-    transcript_truncated = transcript[:max_chars]
-    if len(transcript) > max_chars:
-        transcript_truncated += "\n... [transcript truncated]"
-    
-    prompt = f"""Create comprehensive meeting notes from this transcript.
+Extract 1-3 workflows or processes discussed in the meeting. For each, give a descriptive title, nodes for the steps (id, type, label, optional variant) and edges connecting them (id, source, target, optional label).
+Node types: "process", "decision", "terminal". Terminal variants: "start", "end".
 
-Meeting Title: {title}
+Return a JSON object like:
+{"workflows": [{"title": "Workflow Title", "nodes": [{"id": "n1", "type": "terminal", "label": "Start", "variant": "start"}, {"id": "n2", "type": "decision", "label": "Approve?"}, {"id": "n3", "type": "terminal", "label": "End", "variant": "end"}], "edges": [{"id": "e1", "source": "n1", "target": "n2"}, {"id": "e2", "source": "n2", "target": "n3", "label": "Yes"}]}]}
 
-Transcript:
-{transcript_truncated}
+Focus on clear, actionable workflows. Limit to 3 workflows max."""
+
+SUMMARY_SYSTEM_PROMPT = """You are an expert at creating clear, structured meeting notes.
 
-Generate structured meeting notes with:
+Create comprehensive meeting notes from the transcript with:
 - Key discussion points
 - Decisions made
 - Action items
@@ -245,90 +232,326 @@ Generate structured meeting notes with:
 
 Format as markdown with clear sections and bullet points."""
 
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are an expert at creating clear, structured meeting notes."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-        )
-        
-        summary = response.choices[0].message.content
-        print(f"         ✅ Generated summary ({len(summary)} chars)")
-        return summary
-        
-    except Exception as e:
-        print(f"         ⚠️  Summary generation failed: {e}")
-        return ""
+TITLE_SYSTEM_PROMPT = """You are an expert at creating concise, descriptive titles.
 
+Generate a concise, descriptive title (max 10 words) for the meeting transcript preview.
+Return only the title, no quotes or extra text."""
 
-def generate_title_from_transcript(transcript: str, original_id: str, client: OpenAI) -> str:
-    """Generate a descriptive title from transcript."""
+TITLES_SYSTEM_PROMPT = """You are an expert at creating concise, descriptive titles.
+
+Generate a concise, descriptive title (max 10 words) for each meeting transcript preview. Each preview is labelled with its meeting ID.
+Return a JSON object mapping each meeting ID (without brackets) to its title."""
+
+
+def workflows_request(context: str, title: str) -> Dict[str, Any]:
+    """Build the request that extracts workflows from a truncate_transcript() context."""
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": WORKFLOWS_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Meeting Title: {title}\n\nTranscript:\n{context}"}
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.3,
+    }
+
+
+def summary_request(context: str, title: str) -> Dict[str, Any]:
+    """Build the request that writes meeting notes for a truncate_transcript() context."""
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Meeting Title: {title}\n\nTranscript:\n{context}"}
+        ],
+        "temperature": 0.3,
+    }
+
+
+def title_request(transcript: str) -> Dict[str, Any]:
+    """Build the request that titles a transcript."""
     # Use first 2000 chars
     preview = transcript[:2000]
     
-    prompt = f"""Generate a concise, descriptive title for this meeting transcript (max 10 words).
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": TITLE_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Transcript preview:\n{preview}"}
+        ],
+        "temperature": 0.3,
+        "max_tokens": 50,
+    }
 
-Transcript preview:
-{preview}
 
-Return only the title, no quotes or extra text."""
+def titles_request(previews: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Build the request that titles several transcripts at once, from (uid, transcript) pairs."""
+    # Same 2000-char preview as title_request()
+    sections = "\n\n".join(f"[{uid}]:\n{transcript[:2000]}" for uid, transcript in previews)
+    
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": TITLES_SYSTEM_PROMPT},
+            {"role": "user", "content": sections}
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.3,
+        "max_tokens": 50 * len(previews),
+    }
+
+
+def parse_workflows(content: str) -> List[Dict[str, Any]]:
+    """Parse the workflows out of a workflows_request() response."""
+    result = orjson.loads(content)
+    
+    # Handle both array and object responses
+    return result if isinstance(result, list) else result.get('workflows', [])
+
+
+def parse_title(content: str) -> str:
+    """Clean up a title_request() response."""
+    return content.strip().strip('"')
+
+
+def parse_titles(content: str) -> Dict[str, str]:
+    """Parse the uid -> title map out of a titles_request() response."""
+    result = orjson.loads(content)
+    if not isinstance(result, dict):
+        return {}
+    return {
+        uid: parse_title(title)
+        for uid, title in result.items()
+        if isinstance(title, str) and title.strip()
+    }
+
+
+def make_async_client(api_key: str) -> AsyncOpenAI:
+    """
+    Create the AsyncOpenAI client for one async run.
+    
+    All concurrent calls share its connection pool, which is sized for
+    LLM_CONCURRENCY meetings making two calls at once. Idle connections
+    are kept for a minute rather than the SDK's 5s, so they survive the
+    gaps between long completions and skip new TLS handshakes.
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        max_retries=LLM_MAX_RETRIES,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=2 * LLM_CONCURRENCY,
+                max_keepalive_connections=2 * LLM_CONCURRENCY,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        ),
+    )
 
+
+_llm_cache = None
+
+# Cache lookups this run, by outcome ("hits" / "misses")
+llm_cache_stats = Counter()
+
+
+def get_llm_cache() -> sqlite3.Connection:
+    """Open the LLM response cache, creating it on first use."""
+    global _llm_cache
+    if _llm_cache is None:
+        LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _llm_cache = sqlite3.connect(LLM_CACHE_PATH, isolation_level=None)
+        _llm_cache.execute('''
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                response BLOB NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+        ''')
+    return _llm_cache
+
+
+def cache_key(request: Dict[str, Any]) -> str:
+    """Key a chat.completions.create() body (model, messages, temperature, ...)."""
+    return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def cache_get(key: str):
+    """Cached response content for a cache_key(), or None."""
+    row = get_llm_cache().execute(
+        'SELECT response FROM llm_cache WHERE key = ?', (key,)
+    ).fetchone()
+    llm_cache_stats["hits" if row else "misses"] += 1
+    return row[0].decode() if row else None
+
+
+def cache_put(key: str, content: str):
+    """Store the response content for a cache_key()."""
+    get_llm_cache().execute(
+        'INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)',
+        (key, content.encode(), int(time.time()))
+    )
+
+
+# Requests currently waiting on the API, by cache key
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def cached_chat(client: AsyncOpenAI, request: Dict[str, Any]) -> str:
+    """
+    Run a chat completion, reusing the cached response for an identical request.
+    
+    Sampled (temperature > 0) responses are cached too: the first one
+    becomes the canonical answer for later seeds. Identical requests made
+    while the first is still running (e.g. duplicate transcripts) share its
+    API call.
+    
+    Open-ended requests (no max_tokens, i.e. workflows and summaries) are
+    streamed, so the client timeout bounds the gap between tokens rather
+    than the whole multi-thousand-token response.
+    """
+    # The key hashes the whole prompt, so compute it once per request
+    key = cache_key(request)
+    content = cache_get(key)
+    if content is not None:
+        return content
+    
+    task = _inflight.get(key)
+    if task is None:
+        async def call() -> str:
+            try:
+                if "max_tokens" in request:
+                    response = await client.chat.completions.create(**request)
+                    content = response.choices[0].message.content
+                else:
+                    stream = await client.chat.completions.create(**request, stream=True)
+                    content = "".join([
+                        chunk.choices[0].delta.content or ""
+                        async for chunk in stream
+                        if chunk.choices
+                    ])
+                cache_put(key, content)
+                return content
+            finally:
+                del _inflight[key]
+        
+        task = _inflight[key] = asyncio.ensure_future(call())
+    return await asyncio.shield(task)
+
+
+async def generate_workflows_from_transcript(
+    context: str, 
+    title: str,
+    client: AsyncOpenAI
+) -> List[Dict[str, Any]]:
+    """
+    Generate workflows from a truncate_transcript() context using LLM.
+    Returns list of workflow dicts with nodes/edges.
+    """
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are an expert at creating concise, descriptive titles."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=50,
-        )
+        return parse_workflows(await cached_chat(client, workflows_request(context, title)))
         
-        title = response.choices[0].message.content.strip().strip('"')
-        return title
+    except Exception as e:
+        print(f"         ⚠️  Workflow generation failed for {title[:40]}: {e}")
+        return []
+
+
+async def generate_meeting_summary(
+    context: str, 
+    title: str,
+    client: AsyncOpenAI
+) -> str:
+    """Generate comprehensive meeting notes from a truncate_transcript() context."""
+    try:
+        return await cached_chat(client, summary_request(context, title))
+        
+    except Exception as e:
+        print(f"         ⚠️  Summary generation failed for {title[:40]}: {e}")
+        return ""
+
+
+async def generate_title_from_transcript(transcript: str, original_id: str, client: AsyncOpenAI) -> str:
+    """Generate a descriptive title from transcript."""
+    try:
+        return parse_title(await cached_chat(client, title_request(transcript)))
         
     except Exception as e:
-        print(f"         ⚠️  Title generation failed: {e}")
+        print(f"         ⚠️  Title generation failed for {original_id}: {e}")
         # Fallback to ID-based title
         return f"Meeting {original_id}"
 
 
+# Meetings titled per LLM call
+TITLE_GROUP_SIZE = 10
+
+
+async def generate_titles(meetings: List[Dict[str, Any]], client: AsyncOpenAI) -> Dict[str, str]:
+    """
+    Title meetings TITLE_GROUP_SIZE at a time, one LLM call per group.
+    
+    Returns uid -> title. Meetings missing from a group's answer (or whose
+    group failed) are left out, for the caller to title one by one.
+    """
+    async def title_group(group: List[Dict[str, Any]]) -> Dict[str, str]:
+        try:
+            request = titles_request([(m['uid'], m['transcript']) for m in group])
+            titles = parse_titles(await cached_chat(client, request))
+        except Exception as e:
+            print(f"         ⚠️  Title generation failed for {len(group)} meetings: {e}")
+            return {}
+        return {m['uid']: titles[m['uid']] for m in group if m['uid'] in titles}
+    
+    groups = [meetings[i:i + TITLE_GROUP_SIZE] for i in range(0, len(meetings), TITLE_GROUP_SIZE)]
+    titles = {}
+    for group_titles in await asyncio.gather(*(title_group(group) for group in groups)):
+        titles.update(group_titles)
+    return titles
+
+
+# A run of capitalized words, allowing short lowercase joiners
+# ("Report of the Public Safety and Human Services Committee")
+TITLE_PHRASE_RE = re.compile(
+    r"\b[A-Z][\w'-]*(?:\s+(?:(?:of|the|and|for|from|on|to|in|a)\s+)*[A-Z][\w'-]*)+"
+)
+
+
+def generate_title_local(transcript: str) -> Optional[str]:
+    """
+    Title a transcript from its preamble, without an LLM call.
+    
+    MeetingBank transcripts usually open by reading out the agenda item, so
+    the first capitalized phrase of 3+ words (up to 10 words) is used.
+    Returns None when there is no such phrase.
+    """
+    for match in TITLE_PHRASE_RE.finditer(transcript[:500]):
+        words = match.group().split()
+        if len(words) >= 3:
+            return " ".join(words[:10])
+    return None
+
+
 def create_workflow_objects(workflow_data_list: List[Dict]) -> List[Workflow]:
     """Convert workflow dicts to Workflow objects."""
     workflows = []
     
     for wf_data in workflow_data_list:
         try:
-            nodes = []
-            for node_data in wf_data.get("nodes", []):
-                node = Node(
-                    id=node_data["id"],
-                    type=NodeType(node_data["type"]),
-                    label=node_data["label"],
-                    variant=NodeVariant(node_data["variant"]) if node_data.get("variant") else None
-                )
-                nodes.append(node)
-            
-            edges = []
-            for edge_data in wf_data.get("edges", []):
-                edge = Edge(
-                    id=edge_data["id"],
-                    source=edge_data["source"],
-                    target=edge_data["target"],
-                    label=edge_data.get("label")
-                )
-                edges.append(edge)
+            nodes = wf_data.get("nodes", [])
+            # The LLM sometimes sends "" for non-terminal variants
+            if any("variant" in node and not node["variant"] for node in nodes):
+                nodes = [
+                    {**node, "variant": None} if "variant" in node and not node["variant"] else node
+                    for node in nodes
+                ]
             
-            workflow = Workflow(
-                id=str(uuid.uuid4()),
-                title=wf_data.get("title", "Workflow"),
-                nodes=nodes,
-                edges=edges,
-                sources=[]  # Will be filled during chunking
-            )
+            # Validate the whole tree in one pass rather than node by node
+            workflow = Workflow.model_validate({
+                "id": str(uuid.uuid4()),
+                "title": wf_data.get("title", "Workflow"),
+                "nodes": nodes,
+                "edges": wf_data.get("edges", []),
+                "sources": []  # Will be filled during chunking
+            })
             workflows.append(workflow)
         except Exception as e:
             print(f"         ⚠️  Failed to create workflow: {e}")
@@ -339,10 +562,7 @@ def create_workflow_objects(workflow_data_list: List[Dict]) -> List[Workflow]:
 
 def clear_search_index():
     """Clear the search index."""
-    from pathlib import Path
-    import shutil
-    
-    faiss_dir = Path(__file__).parent / "data" / "faiss"
+    faiss_dir = backend_path / "data" / "faiss"
     if faiss_dir.exists():
         print("🗑️  Clearing search index...")
         shutil.rmtree(faiss_dir)
@@ -351,34 +571,41 @@ def clear_search_index():
 
 
 def index_all_meetings(meetings: List[Dict]):
-    """Index all meetings for search."""
-    from search.indexer import SearchIndexer
+    """
+    Index all meetings for search.
+    
+    Every title, chunk and workflow summary across all meetings is embedded
+    in one batched pass and written in one search-index session.
+    """
+    from search.indexer import get_search_indexer
     
     index_start = time.time()
     print("\n📇 Step 4/4: Indexing meetings for search...")
     print("   " + "-" * 60)
     
-    indexer = SearchIndexer()
+    indexer = get_search_indexer()
+    
+    try:
+        with indexer.bulk_session():
+            results = indexer.index_meetings_bulk([m['meeting_id'] for m in meetings])
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        results = {}
     
+    log = []
     for i, m in enumerate(meetings, 1):
-        meeting_start = time.time()
-        meeting_id = m['meeting_id']
-        title = m['title']
-        progress_pct = int((i / len(meetings)) * 100)
-        
-        print(f"   [{i}/{len(meetings)}] ({progress_pct}%) Indexing: {title[:55]}...", end="", flush=True)
-        
-        try:
-            result = indexer.index_meeting_complete(meeting_id)
+        result = results.get(m['meeting_id'])
+        if result is None:
+            continue
+        log.append(f"   [{i}/{len(meetings)}] {m['title'][:55]}")
+        if "error" in result:
+            log.append(f"      ❌ Error: {result['error']}")
+        else:
+            title_indexed = "✓" if result.get('title_indexed') else "✗"
             chunks = result.get('chunks_indexed', 0)
             workflows = result.get('workflows_indexed', 0)
-            title_indexed = "✓" if result.get('title_indexed') else "✗"
-            
-            index_time = time.time() - meeting_start
-            print(f" ✅ ({format_time(index_time)})")
-            print(f"      {title_indexed} Title | {chunks} chunks | {workflows} workflows")
-        except Exception as e:
-            print(f" ❌ Error: {e}")
+            log.append(f"      {title_indexed} Title | {chunks} chunks | {workflows} workflows")
+    emit(log)
     
     index_total = time.time() - index_start
     print(f"\n   ✅ Indexing complete in {format_time(index_total)}!")
@@ -412,7 +639,381 @@ def format_time(seconds: float) -> str:
         return f"{hours}h {mins}m"
 
 
-def seed_meetingbank_meetings(n: int = 50, seed: int = 42):
+# Write-heavy one-shot run: WAL commits skip the per-commit fsync. WAL mode
+# is stored in the database file, unlike the other pragmas, so
+# seed_connection() puts back the journal mode it found when the run ends
+SEED_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+@contextmanager
+def seed_connection():
+    """Open the connection the seeded meetings are saved through, restoring the journal mode on exit."""
+    conn = connect()
+    conn.row_factory = sqlite3.Row
+    try:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        try:
+            for pragma in SEED_PRAGMAS:
+                conn.execute(pragma)
+            yield conn
+        finally:
+            # save_meetings() commits each write; drop anything a failure left open
+            conn.rollback()
+            conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    finally:
+        conn.close()
+
+
+def meeting_state_versions(
+    meeting: Meeting,
+    chunks: List[str],
+    summary: str,
+    workflows: List[Workflow]
+) -> List[Tuple[str, CurrentStateVersion]]:
+    """Build the (meeting_id, state_version) pairs for a processed meeting."""
+    state_versions = []
+    
+    # Create a version for each chunk so frontend can display them
+    # For seeded meetings, all chunks are finalized at once, so each version
+    # gets the full summary/workflows, but with the correct chunkIndex for matching.
+    # There is no empty version 0 as for live meetings; nothing reads it back
+    for chunk_idx, chunk_text in enumerate(chunks):
+        chunk_state = CurrentStateVersion(
+            version=chunk_idx + 1,  # Version 1 = chunk 0, version 2 = chunk 1, etc.
+            currentStateId=str(uuid.uuid4()),
+            data=CurrentStateData(
+                meetingSummary=summary,  # Full summary for all chunks (they're all finalized)
+                workflows=workflows,      # Full workflows for all chunks
+                chunkText=chunk_text,     # This chunk's text
+                chunkIndex=chunk_idx      # Set chunkIndex so frontend can match chunks to versions
+            )
+        )
+        state_versions.append((meeting.meetingId, chunk_state))
+    
+    return state_versions
+
+
+def save_meetings(
+    meetings: List[Meeting],
+    state_versions: List[Tuple[str, CurrentStateVersion]],
+    conn: sqlite3.Connection
+):
+    """Write every processed meeting and state version in one transaction on conn."""
+    save_start = time.time()
+    with conn:
+        create_meetings(meetings, conn)
+        add_state_versions(state_versions, conn)
+    print(f"\n   💾 Saved {len(meetings)} meetings and {len(state_versions)} state versions "
+          f"in {format_time(time.time() - save_start)}")
+
+
+def transcript_hash(transcript: str) -> str:
+    """Content hash used to recognise a transcript that is already seeded."""
+    return hashlib.sha256(transcript.encode()).hexdigest()
+
+
+def existing_meeting_records(meetings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Find the MeetingBank meetings whose transcript is already seeded in the
+    eval org, matched by transcript_hash().
+    
+    Returns created-meeting records (as built by build_meeting()) keyed by
+    MeetingBank UID, so those meetings can skip every LLM call.
+    """
+    by_hash = {
+        transcript_hash(meeting.transcript): meeting
+        for meeting in get_meetings_by_org(EVAL_ORG_ID)
+        if meeting.transcript
+    }
+    matches = {}
+    for mb_meeting in meetings:
+        # pop, so a stored meeting is reused at most once
+        meeting = by_hash.pop(transcript_hash(mb_meeting['transcript']), None)
+        if meeting is not None:
+            matches[mb_meeting['uid']] = (mb_meeting, meeting)
+    
+    states = get_latest_state_versions([meeting.meetingId for _, meeting in matches.values()])
+    records = {}
+    for uid, (mb_meeting, meeting) in matches.items():
+        state = states.get(meeting.meetingId)
+        records[uid] = {
+            "meeting_id": meeting.meetingId,
+            "org_id": meeting.orgId,
+            "title": meeting.title,
+            "city": mb_meeting['city'],
+            "original_uid": uid,
+            "workflows_count": len(state.data.workflows) if state else 0,
+            "chunks_count": meeting.totalChunks,
+            "summary_length": len(state.data.meetingSummary) if state else 0
+        }
+    return records
+
+
+def build_meeting(
+    mb_meeting: Dict[str, Any],
+    meeting_id: str,
+    title: str,
+    workflow_data: List[Dict[str, Any]],
+    summary: str
+):
+    """
+    Assemble a meeting from its generated title, workflows and summary.
+    
+    Returns:
+        (meeting, chunks, workflows, created-meeting record)
+    """
+    transcript = mb_meeting['transcript']
+    org_id = EVAL_ORG_ID  # All meetings in same org
+    workflows = create_workflow_objects(workflow_data)
+    chunks = chunk_transcript(transcript)
+    
+    meeting = Meeting(
+        meetingId=meeting_id,
+        status=Status.finalized,
+        orgId=org_id,
+        title=title,
+        transcript=transcript,
+        totalChunks=len(chunks)
+    )
+    record = {
+        "meeting_id": meeting_id,
+        "org_id": org_id,
+        "title": title,
+        "city": mb_meeting['city'],
+        "original_uid": mb_meeting['uid'],
+        "workflows_count": len(workflows),
+        "chunks_count": len(chunks),
+        "summary_length": len(summary)
+    }
+    return meeting, chunks, workflows, record
+
+
+async def process_meetings(
+    meetings: List[Dict[str, Any]], 
+    client: AsyncOpenAI,
+    conn: sqlite3.Connection,
+    local_titles: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Generate every meeting, LLM_CONCURRENCY meetings at a time, then save
+    them all in one transaction.
+    
+    Titles are generated first, in groups (see generate_titles()). With
+    local_titles, generate_title_local() is tried before the LLM.
+    
+    Returns the created-meeting dicts in input order, each with a
+    "processing_time" entry in seconds.
+    """
+    titles = {}
+    if local_titles:
+        for mb_meeting in meetings:
+            title = generate_title_local(mb_meeting['transcript'])
+            if title:
+                titles[mb_meeting['uid']] = title
+    titles.update(await generate_titles([m for m in meetings if m['uid'] not in titles], client))
+    
+    semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+    # Saved together once every meeting is generated
+    new_meetings = []
+    state_versions = []
+    completed = 0
+    
+    async def process_meeting(mb_meeting: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal completed
+        async with semaphore:
+            meeting_start = time.time()
+            meeting_id = str(uuid.uuid4())
+            transcript = mb_meeting['transcript']
+            
+            # The workflow and summary prompts include the title
+            title = titles.get(mb_meeting['uid'])
+            if not title:
+                title = await generate_title_from_transcript(transcript, mb_meeting['uid'], client)
+            context = truncate_transcript(transcript)
+            workflow_data, summary = await asyncio.gather(
+                generate_workflows_from_transcript(context, title, client),
+                generate_meeting_summary(context, title, client),
+            )
+            # Validation, chunking and model construction run in a worker
+            # thread so they don't stall the other meetings' HTTP reads
+            meeting, chunks, workflows, record = await asyncio.to_thread(
+                build_meeting, mb_meeting, meeting_id, title, workflow_data, summary
+            )
+            new_meetings.append(meeting)
+            state_versions.extend(await asyncio.to_thread(
+                meeting_state_versions, meeting, chunks, summary, workflows
+            ))
+            
+            meeting_time = time.time() - meeting_start
+            completed += 1
+            emit([
+                f"\n[{completed}/{len(meetings)}] ✅ {mb_meeting['uid'][:50]} ({format_time(meeting_time)})",
+                f"      📌 {title}",
+                f"      📊 Stats: {len(workflows)} workflows, {len(chunks)} chunks, {len(summary)} chars",
+            ])
+            
+            record["processing_time"] = meeting_time
+            return record
+    
+    created_meetings = list(await asyncio.gather(*(process_meeting(m) for m in meetings)))
+    save_meetings(new_meetings, state_versions, conn)
+    return created_meetings
+
+
+# Seconds between Batch API status checks
+BATCH_POLL_SECONDS = 30
+
+
+def run_batch(client: OpenAI, requests: Dict[str, Dict[str, Any]], label: str) -> Dict[str, Any]:
+    """
+    Run chat completion requests through the OpenAI Batch API and wait for them.
+    Cached responses are reused; only the rest are submitted.
+    
+    Args:
+        client: OpenAI client
+        requests: custom_id -> chat.completions.create() body
+        label: Name for progress output
+    
+    Returns:
+        custom_id -> response content, or None where the request failed
+    """
+    import io
+    
+    keys = {custom_id: cache_key(body) for custom_id, body in requests.items()}
+    results = {custom_id: cache_get(key) for custom_id, key in keys.items()}
+    requests = {
+        custom_id: body for custom_id, body in requests.items()
+        if results[custom_id] is None
+    }
+    if not requests:
+        print(f"   ✅ {label} responses all cached")
+        return results
+    
+    lines = [
+        orjson.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+        for custom_id, body in requests.items()
+    ]
+    batch_file = client.files.create(
+        file=("seed_batch.jsonl", io.BytesIO(b"\n".join(lines))),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"   ⏳ Submitted {label} batch {batch.id} ({len(requests)} requests)")
+    
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(BATCH_POLL_SECONDS)
+        batch = client.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        if counts:
+            print(f"      {batch.status}: {counts.completed}/{counts.total} done, {counts.failed} failed")
+    
+    if batch.status != "completed":
+        raise RuntimeError(f"{label} batch {batch.id} ended with status {batch.status}")
+    
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                content = response["body"]["choices"][0]["message"]["content"]
+                results[item["custom_id"]] = content
+                cache_put(keys[item["custom_id"]], content)
+    
+    failed = sum(1 for content in results.values() if content is None)
+    print(f"   ✅ {label} batch complete ({failed} failed requests)")
+    return results
+
+
+def process_meetings_batch(
+    meetings: List[Dict[str, Any]], 
+    client: OpenAI,
+    conn: sqlite3.Connection,
+    local_titles: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Generate every meeting through the Batch API, then save them all in one
+    transaction.
+    
+    Titles go in a first batch because the workflow and summary prompts
+    include them (with local_titles, only those generate_title_local()
+    can't find); workflows and summaries share the second batch. Requests
+    are tagged title:{id}, workflows:{id} and summary:{id}.
+    """
+    batch_start = time.time()
+    meeting_ids = [str(uuid.uuid4()) for _ in meetings]
+    
+    titles = {}
+    if local_titles:
+        for meeting_id, mb_meeting in zip(meeting_ids, meetings):
+            title = generate_title_local(mb_meeting['transcript'])
+            if title:
+                titles[meeting_id] = title
+    
+    title_results = run_batch(client, {
+        f"title:{meeting_id}": title_request(mb_meeting['transcript'])
+        for meeting_id, mb_meeting in zip(meeting_ids, meetings)
+        if meeting_id not in titles
+    }, "title")
+    for meeting_id, mb_meeting in zip(meeting_ids, meetings):
+        if meeting_id in titles:
+            continue
+        content = title_results[f"title:{meeting_id}"]
+        titles[meeting_id] = parse_title(content) if content else f"Meeting {mb_meeting['uid']}"
+    
+    requests = {}
+    for meeting_id, mb_meeting in zip(meeting_ids, meetings):
+        context, title = truncate_transcript(mb_meeting['transcript']), titles[meeting_id]
+        requests[f"workflows:{meeting_id}"] = workflows_request(context, title)
+        requests[f"summary:{meeting_id}"] = summary_request(context, title)
+    results = run_batch(client, requests, "workflow/summary")
+    
+    created_meetings = []
+    new_meetings = []
+    state_versions = []
+    for meeting_id, mb_meeting in zip(meeting_ids, meetings):
+        title = titles[meeting_id]
+        workflow_data = []
+        content = results[f"workflows:{meeting_id}"]
+        if content:
+            try:
+                workflow_data = parse_workflows(content)
+            except ValueError as e:
+                print(f"         ⚠️  Workflow generation failed for {title[:40]}: {e}")
+        summary = results[f"summary:{meeting_id}"] or ""
+        
+        meeting, chunks, workflows, record = build_meeting(
+            mb_meeting, meeting_id, title, workflow_data, summary
+        )
+        new_meetings.append(meeting)
+        state_versions.extend(meeting_state_versions(meeting, chunks, summary, workflows))
+        created_meetings.append(record)
+        print(f"   ✅ {title[:55]} - {len(workflows)} workflows, {len(chunks)} chunks, {len(summary)} chars")
+    
+    save_meetings(new_meetings, state_versions, conn)
+    
+    # Batch requests have no per-meeting timing, so spread the total evenly
+    per_meeting = (time.time() - batch_start) / max(len(meetings), 1)
+    for record in created_meetings:
+        record["processing_time"] = per_meeting
+    return created_meetings
+
+
+def seed_meetingbank_meetings(
+    n: int = 50,
+    seed: int = 42,
+    batch: bool = False,
+    local_titles: bool = False,
+    incremental: bool = False
+):
     """Main seeding function - complete replacement for seed_db.py."""
     start_time = time.time()
     
@@ -429,8 +1030,6 @@ def seed_meetingbank_meetings(n: int = 50, seed: int = 42):
         print("❌ Error: OPENAI_API_KEY not found in environment")
         sys.exit(1)
     
-    client = OpenAI(api_key=api_key)
-    
     # Load meetings
     print("\n📚 Step 1/4: Loading meetings from MeetingBank...")
     load_start = time.time()
@@ -438,10 +1037,20 @@ def seed_meetingbank_meetings(n: int = 50, seed: int = 42):
     load_time = time.time() - load_start
     print(f"   ✅ Loaded {len(meetings)} meetings in {format_time(load_time)}")
     
-    # Clear existing database
+    # Clear existing database; with incremental, keep meetings whose
+    # transcript is already seeded and clear only the rest
     print("\n🗑️  Step 2/4: Clearing existing database and indices...")
+    reused = {}
     clear_start = time.time()
-    if os.path.exists(DB_PATH):
+    if incremental and os.path.exists(DB_PATH):
+        init_db()
+        reused = existing_meeting_records(meetings)
+        kept = {record['meeting_id'] for record in reused.values()}
+        with get_db() as conn:
+            stale = [row[0] for row in conn.execute('SELECT meeting_id FROM meetings') if row[0] not in kept]
+            delete_meetings(stale, conn)
+        print(f"   ♻️  Reusing {len(reused)} seeded meetings, removed {len(stale)} others")
+    elif os.path.exists(DB_PATH):
         with get_db() as conn:
             conn.execute('DELETE FROM state_versions')
             conn.execute('DELETE FROM meetings')
@@ -454,121 +1063,38 @@ def seed_meetingbank_meetings(n: int = 50, seed: int = 42):
     clear_time = time.time() - clear_start
     print(f"   ✅ Cleanup complete in {format_time(clear_time)}")
     
-    # Process each meeting
-    print(f"\n📝 Step 3/4: Processing {len(meetings)} meetings...")
-    print("   This will take ~1-2 minutes per meeting due to LLM API calls")
-    print("   " + "-" * 60)
-    
-    created_meetings = []
-    meeting_times = []
-    
-    for i, mb_meeting in enumerate(meetings, 1):
-        meeting_start = time.time()
-        progress_pct = int((i / len(meetings)) * 100)
-        
-        print(f"\n[{i}/{len(meetings)}] ({progress_pct}%) Processing: {mb_meeting['uid'][:50]}...")
-        
-        meeting_id = str(uuid.uuid4())
-        transcript = mb_meeting['transcript']
-        org_id = EVAL_ORG_ID  # All meetings in same org
-        
-        # Generate title
-        print(f"   ⏳ Generating title...", end="", flush=True)
-        title_start = time.time()
-        title = generate_title_from_transcript(transcript, mb_meeting['uid'], client)
-        title_time = time.time() - title_start
-        print(f" ✅ ({format_time(title_time)})")
-        print(f"      📌 {title}")
-        
-        # Chunk transcript
-        print(f"   ⏳ Chunking transcript...", end="", flush=True)
-        chunk_start = time.time()
-        chunks = chunk_transcript(transcript)
-        chunk_time = time.time() - chunk_start
-        print(f" ✅ ({format_time(chunk_time)}) - {len(chunks)} chunks")
+    to_process = [m for m in meetings if m['uid'] not in reused]
+    if not to_process:
+        print("\n📝 Step 3/4: Every meeting is already seeded, nothing to generate")
+        processed = []
+    elif batch:
+        # Offline: half-price Batch API requests, up to 24h turnaround
+        print(f"\n📝 Step 3/4: Processing {len(to_process)} meetings with the Batch API...")
+        print("   Batches can take up to 24h to complete")
+        print("   " + "-" * 60)
         
-        # Create meeting
-        meeting = Meeting(
-            meetingId=meeting_id,
-            status=Status.finalized,
-            orgId=org_id,
-            title=title,
-            transcript=transcript,
-            totalChunks=len(chunks)
-        )
-        create_meeting(meeting)
-        
-        # Generate workflows
-        print(f"   ⏳ Generating workflows...", end="", flush=True)
-        workflow_start = time.time()
-        workflow_data = generate_workflows_from_transcript(transcript, title, client)
-        workflows = create_workflow_objects(workflow_data)
-        workflow_time = time.time() - workflow_start
-        print(f" ✅ ({format_time(workflow_time)}) - {len(workflows)} workflows")
-        
-        # Generate summary
-        print(f"   ⏳ Generating summary...", end="", flush=True)
-        summary_start = time.time()
-        summary = generate_meeting_summary(transcript, title, client)
-        summary_time = time.time() - summary_start
-        print(f" ✅ ({format_time(summary_time)}) - {len(summary)} chars")
-        
-        # Create initial state (version 0)
-        initial_state = CurrentStateVersion(
-            version=0,
-            currentStateId=str(uuid.uuid4()),
-            data=CurrentStateData(
-                meetingSummary="",
-                workflows=[],
-                chunkText=""
-            )
-        )
-        add_state_version(meeting_id, initial_state)
+        with seed_connection() as conn:
+            processed = process_meetings_batch(to_process, OpenAI(api_key=api_key), conn, local_titles)
+    else:
+        # Process meetings concurrently
+        print(f"\n📝 Step 3/4: Processing {len(to_process)} meetings ({LLM_CONCURRENCY} at a time)...")
+        print("   Each meeting takes ~1-2 minutes due to LLM API calls")
+        print("   " + "-" * 60)
         
-        # Create a version for each chunk so frontend can display them
-        # For seeded meetings, all chunks are finalized at once, so each version
-        # gets the full summary/workflows, but with the correct chunkIndex for matching
-        for chunk_idx, chunk_text in enumerate(chunks):
-            chunk_state = CurrentStateVersion(
-                version=chunk_idx + 1,  # Version 1 = chunk 0, version 2 = chunk 1, etc.
-                currentStateId=str(uuid.uuid4()),
-                data=CurrentStateData(
-                    meetingSummary=summary,  # Full summary for all chunks (they're all finalized)
-                    workflows=workflows,      # Full workflows for all chunks
-                    chunkText=chunk_text,     # This chunk's text
-                    chunkIndex=chunk_idx      # Set chunkIndex so frontend can match chunks to versions
-                )
+        with seed_connection() as conn:
+            processed = asyncio.run(
+                process_meetings(to_process, make_async_client(api_key), conn, local_titles)
             )
-            add_state_version(meeting_id, chunk_state)
-        
-        created_meetings.append({
-            "meeting_id": meeting_id,
-            "org_id": org_id,
-            "title": title,
-            "city": mb_meeting['city'],
-            "original_uid": mb_meeting['uid'],
-            "workflows_count": len(workflows),
-            "chunks_count": len(chunks),
-            "summary_length": len(summary)
-        })
-        
-        meeting_time = time.time() - meeting_start
-        meeting_times.append(meeting_time)
-        avg_time = sum(meeting_times) / len(meeting_times)
-        remaining = avg_time * (len(meetings) - i)
-        
-        print(f"   ✅ Meeting complete in {format_time(meeting_time)}")
-        print(f"      📊 Stats: {len(workflows)} workflows, {len(chunks)} chunks, {len(summary)} chars")
-        if i < len(meetings):
-            print(f"      ⏱️  Avg: {format_time(avg_time)}/meeting | Est. remaining: {format_time(remaining)}")
-        
-        # Small delay to avoid rate limits
-        if i < len(meetings):
-            time.sleep(0.5)
+    meeting_times = [m.pop("processing_time") for m in processed]
+    
+    # Input order, reused and new meetings together
+    records = {**reused, **{m['original_uid']: m for m in processed}}
+    created_meetings = [records[m['uid']] for m in meetings]
     
     total_time = time.time() - start_time
-    print(f"\n   ✅ Processed {len(meetings)} meetings in {format_time(total_time)}")
-    print(f"   📊 Average: {format_time(sum(meeting_times) / len(meeting_times))} per meeting")
+    print(f"\n   ✅ Processed {len(to_process)} meetings in {format_time(total_time)}")
+    if meeting_times:
+        print(f"   📊 Average: {format_time(sum(meeting_times) / len(meeting_times))} per meeting")
     
     return created_meetings
 
@@ -585,10 +1111,15 @@ def main():
     parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
     parser.add_argument("--skip-indexing", action="store_true", help="Skip search indexing step")
     parser.add_argument("--skip-questions", action="store_true", help="Skip ground truth question generation")
+    parser.add_argument("--batch", action="store_true", help="Generate meeting content with the OpenAI Batch API (cheaper, up to 24h)")
+    parser.add_argument("--local-titles", action="store_true", help="Title meetings from their opening agenda item, using the LLM only as a fallback")
+    parser.add_argument("--incremental", action="store_true", help="Keep meetings whose transcript is already seeded instead of regenerating them")
     args = parser.parse_args()
     
     # Seed meetings
-    created_meetings = seed_meetingbank_meetings(args.n, args.seed)
+    created_meetings = seed_meetingbank_meetings(
+        args.n, args.seed, batch=args.batch, local_titles=args.local_titles, incremental=args.incremental
+    )
     
     # Index meetings for search
     if not args.skip_indexing:
@@ -614,12 +1145,15 @@ def main():
     print(f"   Organization: {EVAL_ORG_ID}")
     print(f"   Database location: {DB_PATH}")
     
-    print("\n   Meetings by city:")
-    city_counts = {}
-    for m in created_meetings:
-        city_counts[m['city']] = city_counts.get(m['city'], 0) + 1
-    for city, count in sorted(city_counts.items()):
-        print(f"   - {city}: {count} meetings")
+    lookups = llm_cache_stats["hits"] + llm_cache_stats["misses"]
+    if lookups:
+        print(f"   LLM cache: {llm_cache_stats['hits']}/{lookups} hits "
+              f"({llm_cache_stats['hits'] / lookups:.0%}), {LLM_CACHE_PATH.name}")
+    
+    city_counts = Counter(m['city'] for m in created_meetings)
+    emit(["\n   Meetings by city:"] + [
+        f"   - {city}: {count} meetings" for city, count in sorted(city_counts.items())
+    ])
     
     if not args.skip_indexing:
         print("\n   ✅ Search indices built and ready")
@@ -632,191 +1166,227 @@ def main():
     print()
 
 
+SINGLE_QUESTION_SYSTEM_PROMPT = """You generate specific, answerable questions about meetings.
+
+Generate ONE specific question that someone might ask about the meeting and that can be answered using it.
+Make it natural and specific to the content.
+Return only the question, no extra text."""
+
+MULTI_QUESTION_SYSTEM_PROMPT = """You generate questions that span multiple meetings.
+
+Generate ONE question that requires information from MULTIPLE of the given meetings to answer.
+Examples: "What were the recurring themes?", "How did the approach change over time?"
+Return only the question."""
+
+
+def single_question_request(meeting_obj: Meeting) -> Dict[str, Any]:
+    """Build the request for a question answered by one meeting."""
+    transcript_preview = meeting_obj.transcript[:1500] if meeting_obj.transcript else ""
+    
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": SINGLE_QUESTION_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Meeting Title: {meeting_obj.title}\nTranscript Preview: {transcript_preview}"}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 100,
+    }
+
+
+def multi_question_request(city: str, sample_meetings: List[Dict]) -> Dict[str, Any]:
+    """Build the request for a question spanning several meetings from one city."""
+    # Build context from multiple meetings
+    context = "".join(
+        f"\nMeeting: {sm['meeting_obj'].title}\n{sm['meeting_obj'].transcript[:800]}...\n"
+        for sm in sample_meetings
+    )
+    
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": MULTI_QUESTION_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Context from {len(sample_meetings)} meetings in {city}:\n{context}"}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 100,
+    }
+
+
+async def generate_questions(
+    requests: List[Tuple[str, Dict[str, Any]]], 
+    label: str,
+    client: AsyncOpenAI
+) -> List[Any]:
+    """
+    Run (description, request) question prompts, LLM_CONCURRENCY at a time.
+    
+    Returns the cleaned-up questions in input order, None where one failed.
+    """
+    semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+    completed = 0
+    
+    async def generate_question(description: str, request: Dict[str, Any]):
+        nonlocal completed
+        async with semaphore:
+            q_start = time.time()
+            try:
+                query = (await cached_chat(client, request)).strip().strip('"')
+            except Exception as e:
+                print(f"      ⚠️  Failed to generate {label} question for {description}: {e}")
+                return None
+            
+            completed += 1
+            if completed % 5 == 0 or completed == len(requests):
+                print(f"      [{completed}/{len(requests)}] Generated ({format_time(time.time() - q_start)} each)")
+            return query
+    
+    return list(await asyncio.gather(*(generate_question(*r) for r in requests)))
+
+
 def generate_ground_truth_questions(meetings: List[Dict], seed: int = 42) -> List[Dict]:
     """
     Generate ground truth test cases from meetings.
     Mix of single-meeting and multi-meeting questions.
+    
+    Meetings are sampled up front; the questions are then generated
+    concurrently.
     """
     questions_start = time.time()
     print("\n🎯 Generating ground truth test cases...")
     print("   " + "-" * 60)
     
     api_key = os.getenv("OPENAI_API_KEY")
-    client = OpenAI(api_key=api_key)
+    client = make_async_client(api_key)
     
-    random.seed(seed)
+    # Local generator: leaves the global random state alone
+    rng = random.Random(seed)
     test_cases = []
     
     # Get meetings from DB with full content
     print("   📥 Loading meetings from database...")
-    db_meetings = []
-    for m in meetings[:40]:  # Limit to 40 to avoid token limits
-        try:
-            meeting_obj = get_meeting(m['meeting_id'])
-            if meeting_obj:
-                db_meetings.append({
-                    **m,
-                    'meeting_obj': meeting_obj
-                })
-        except:
-            continue
+    meetings = meetings[:40]  # Limit to 40 to avoid token limits
+    meeting_objs = {
+        meeting_obj.meetingId: meeting_obj
+        for meeting_obj in get_meetings([m['meeting_id'] for m in meetings])
+    }
+    db_meetings = [
+        {**m, 'meeting_obj': meeting_objs[m['meeting_id']]}
+        for m in meetings
+        if m['meeting_id'] in meeting_objs
+    ]
     print(f"   ✅ Loaded {len(db_meetings)} meetings")
     
-    # Generate single-meeting questions (30 cases)
-    print(f"\n   📝 Generating single-meeting questions (target: 30)...")
-    single_meeting_sample = random.sample(db_meetings, min(30, len(db_meetings)))
-    
-    for i, m in enumerate(single_meeting_sample, 1):
-        q_start = time.time()
-        meeting_obj = m['meeting_obj']
-        transcript_preview = meeting_obj.transcript[:1500] if meeting_obj.transcript else ""
-        
-        prompt = f"""Generate a specific question that can be answered using this meeting.
-
-Meeting Title: {meeting_obj.title}
-Transcript Preview: {transcript_preview}
-
-Generate ONE specific question that someone might ask about this meeting.
-Make it natural and specific to the content.
-Return only the question, no extra text."""
-
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You generate specific, answerable questions about meetings."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=100,
-            )
-            
-            query = response.choices[0].message.content.strip().strip('"')
-            
-            test_cases.append({
-                "id": f"tc_single_{i:03d}",
-                "query": query,
-                "org_id": m['org_id'],
-                "relevant_docs": [
-                    {
-                        "doc_id": f"meeting_title:{m['meeting_id']}:",
-                        "relevance": 2
-                    }
-                ],
-                "tags": ["single-meeting", m['city']]
-            })
-            
-            q_time = time.time() - q_start
-            if i % 5 == 0 or i == len(single_meeting_sample):
-                print(f"      [{i}/{len(single_meeting_sample)}] Generated ({format_time(q_time)} each)")
-            time.sleep(0.3)
-                
-        except Exception as e:
-            print(f"      ⚠️  Failed to generate question for {m['title']}: {e}")
-            continue
+    # Sample from a fixed order so the same seed gives byte-identical prompts
+    # across runs; meeting IDs are fresh UUIDs, so order by MeetingBank UID
+    db_meetings.sort(key=lambda m: m['original_uid'])
     
-    # Generate multi-meeting questions (10 cases)
-    print(f"\n   📝 Generating multi-meeting questions (target: 10)...")
+    # Single-meeting questions (30 cases)
+    single_meeting_sample = rng.sample(db_meetings, min(30, len(db_meetings)))
     
     # Group by city for multi-meeting questions
-    by_city = {}
+    by_city = defaultdict(list)
     for m in db_meetings:
-        city = m['city']
-        if city not in by_city:
-            by_city[city] = []
-        by_city[city].append(m)
+        by_city[m['city']].append(m)
     
-    multi_count = 0
-    for city, city_meetings in by_city.items():
+    # Multi-meeting questions (10 cases), 2-3 meetings from the same city
+    multi_samples = []
+    for city, city_meetings in sorted(by_city.items()):
         if len(city_meetings) < 2:
             continue
         
-        if multi_count >= 10:
+        if len(multi_samples) >= 10:
             break
         
-        # Sample 2-3 meetings from same city
         sample_size = min(3, len(city_meetings))
-        sample_meetings = random.sample(city_meetings, sample_size)
-        
-        # Build context from multiple meetings
-        context = ""
-        for sm in sample_meetings:
-            meeting_obj = sm['meeting_obj']
-            context += f"\nMeeting: {meeting_obj.title}\n"
-            context += meeting_obj.transcript[:800] + "...\n"
-        
-        q_start = time.time()
-        prompt = f"""Generate a question that requires information from MULTIPLE meetings to answer.
-
-Context from {len(sample_meetings)} meetings in {city}:
-{context}
-
-Generate ONE question that would require looking across these meetings.
-Examples: "What were the recurring themes?", "How did the approach change over time?"
-Return only the question."""
-
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You generate questions that span multiple meetings."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=100,
-            )
-            
-            query = response.choices[0].message.content.strip().strip('"')
-            
-            test_cases.append({
-                "id": f"tc_multi_{multi_count+1:03d}",
-                "query": query,
-                "org_id": sample_meetings[0]['org_id'],
-                "relevant_docs": [
-                    {
-                        "doc_id": f"meeting_title:{sm['meeting_id']}:",
-                        "relevance": 2
-                    }
-                    for sm in sample_meetings
-                ],
-                "tags": ["multi-meeting", city]
-            })
-            
-            multi_count += 1
-            q_time = time.time() - q_start
-            print(f"      [{multi_count}/10] Generated ({format_time(q_time)})")
-            time.sleep(0.3)
-            
-        except Exception as e:
-            print(f"      ⚠️  Failed to generate multi-meeting question: {e}")
+        multi_samples.append((city, rng.sample(city_meetings, sample_size)))
+    
+    async def generate_all():
+        return await asyncio.gather(
+            generate_questions([
+                (m['title'], single_question_request(m['meeting_obj']))
+                for m in single_meeting_sample
+            ], "single-meeting", client),
+            generate_questions([
+                (city, multi_question_request(city, sample_meetings))
+                for city, sample_meetings in multi_samples
+            ], "multi-meeting", client),
+        )
+    
+    print(f"\n   📝 Generating {len(single_meeting_sample)} single-meeting and "
+          f"{len(multi_samples)} multi-meeting questions ({LLM_CONCURRENCY} at a time)...")
+    single_queries, multi_queries = asyncio.run(generate_all())
+    
+    for i, (m, query) in enumerate(zip(single_meeting_sample, single_queries), 1):
+        if query is None:
             continue
+        test_cases.append({
+            "id": f"tc_single_{i:03d}",
+            "query": query,
+            "org_id": m['org_id'],
+            "relevant_docs": [
+                {
+                    "doc_id": f"meeting_title:{m['meeting_id']}:",
+                    "relevance": 2
+                }
+            ],
+            "tags": ["single-meeting", m['city']]
+        })
+    
+    multi_count = 0
+    for (city, sample_meetings), query in zip(multi_samples, multi_queries):
+        if query is None:
+            continue
+        multi_count += 1
+        test_cases.append({
+            "id": f"tc_multi_{multi_count:03d}",
+            "query": query,
+            "org_id": sample_meetings[0]['org_id'],
+            "relevant_docs": [
+                {
+                    "doc_id": f"meeting_title:{sm['meeting_id']}:",
+                    "relevance": 2
+                }
+                for sm in sample_meetings
+            ],
+            "tags": ["multi-meeting", city]
+        })
     
     questions_time = time.time() - questions_start
     print(f"\n   ✅ Generated {len(test_cases)} total test cases in {format_time(questions_time)}")
-    print(f"      Single-meeting: {sum(1 for tc in test_cases if 'single-meeting' in tc['tags'])}")
-    print(f"      Multi-meeting: {sum(1 for tc in test_cases if 'multi-meeting' in tc['tags'])}")
+    tag_counts = Counter(tag for tc in test_cases for tag in tc['tags'])
+    print(f"      Single-meeting: {tag_counts['single-meeting']}")
+    print(f"      Multi-meeting: {tag_counts['multi-meeting']}")
     
     return test_cases
 
 
 def save_ground_truth(test_cases: List[Dict], output_path: str, n_meetings: int):
-    """Save ground truth test cases to JSON."""
-    import json
+    """
+    Save ground truth test cases to JSON.
+    
+    Test cases are serialized and written one at a time, in the same
+    indent-2 layout as json.dump, rather than as one buffer for the whole file.
+    """
     from datetime import datetime
     
-    dataset = {
+    header = {
         "name": f"meetingbank-{n_meetings}",
         "description": f"Test dataset from {n_meetings} MeetingBank meetings with generated questions",
         "version": "1.0",
         "generated_at": datetime.utcnow().isoformat() + "Z",
-        "test_cases": test_cases
     }
     
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
+    with open(output_path, 'wb') as f:
+        # Reopen the header object to append the test_cases array
+        f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2)[:-2] + b',\n  "test_cases": [')
+        for i, tc in enumerate(test_cases):
+            f.write(b",\n    " if i else b"\n    ")
+            f.write(orjson.dumps(tc, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n    "))
+        f.write(b"\n  ]\n}" if test_cases else b"]\n}")
     
     print(f"\n💾 Saved ground truth to: {output_path}")
 
@@ -4,21 +4,106 @@ Standalone script for testing chunk processing + LLM logic without the API.
 Usage:
     python main.py                    # Run with sample transcript
     python main.py "your transcript"  # Run with custom transcript
+    python main.py --batch            # Use the OpenAI Batch API
+    python main.py --check-models     # Check every routed model accepts the request
 """
 
 import os
 import re
 import json
 import sys
-from openai import OpenAI
+import time
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from typing import Iterable, Iterator
+import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
 from pathlib import Path
 
 # Load .env from project root
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
+# Sentence splitter for transcript chunking, compiled once
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Max chunk requests in flight at once
+CHUNK_CONCURRENCY = 10
+
+# Connection pool shared by the requests of one client: enough connections
+# for every concurrent request, and idle ones kept for a minute (the SDK
+# default is 5s) so later requests skip new TCP/TLS handshakes
+HTTP_LIMITS = httpx.Limits(
+    max_connections=CHUNK_CONCURRENCY,
+    max_keepalive_connections=CHUNK_CONCURRENCY,
+    keepalive_expiry=60.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# Retries per request on 429s, 5xx, timeouts and connection errors, before
+# the error reaches the fallback in pass_chunk and friends. The SDK backs
+# off exponentially with jitter and honours Retry-After
+LLM_MAX_RETRIES = 5
+
 # Initialize OpenAI client
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+client = OpenAI(
+    api_key=os.getenv('OPENAI_API_KEY'),
+    max_retries=LLM_MAX_RETRIES,
+    http_client=DefaultHttpxClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+)
+
+
+def make_async_client() -> AsyncOpenAI:
+    """
+    Creates the AsyncOpenAI client for one asyncio.run(); its connections
+    are bound to that event loop, so each run gets its own client.
+    """
+    return AsyncOpenAI(
+        api_key=os.getenv('OPENAI_API_KEY'),
+        max_retries=LLM_MAX_RETRIES,
+        http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    )
+
+# Max transcript characters sent in one request. Chunks are grouped into
+# batches up to this size; a longer transcript's batches are processed
+# concurrently and then merged
+CHUNK_BATCH_CHARS = 12000
+
+# Parameters shared by every chunk-processing and merge request. The output
+# cap bounds decode time; it leaves room for a batch's summary and diagrams.
+# A response cut off by it raises TruncatedResponseError, and the chunk
+# batch is split in two and retried (see pass_chunks_batched)
+COMPLETION_PARAMS = {
+    "model": "gpt-5.2",
+    "temperature": 0.3,
+    "max_completion_tokens": 2000,
+    "response_format": {"type": "json_object"},
+}
+
+# Chunk text that reads like a process goes to the full model above; short
+# text without process language (e.g. "Same for design.") only touches the
+# summary, so it goes to a smaller, faster model. It must accept every
+# COMPLETION_PARAMS setting: reasoning models such as gpt-5-nano reject
+# temperature and spend the output cap on reasoning tokens (--check-models)
+SIMPLE_CHUNK_MODEL = "gpt-4.1-mini"
+SIMPLE_CHUNK_MAX_CHARS = 200
+PROCESS_LANGUAGE = re.compile(
+    r'\b(?:deploy|build|flow|process|workflow|step|then|next|after|before|first|'
+    r'approv|review|submit|send|hand ?off|escalat|assign|release|test|merge|'
+    r'onboard|pipeline|stage|phase)\w*',
+    re.IGNORECASE
+)
+
+# Optional on-disk copy of the response cache, for hits across runs (--cache)
+RESPONSE_CACHE_PATH = Path(__file__).resolve().parent / "data" / "chunk_cache.sqlite"
+
+# Batch API polling interval bounds (seconds); the interval doubles per poll
+BATCH_POLL_MIN_SECONDS = 5
+BATCH_POLL_MAX_SECONDS = 60
 
 
 # ==================== CORE FUNCTIONS ====================
@@ -47,113 +132,490 @@ def chunk_transcript(transcript: str) -> list[str]:
     Returns:
         List of chunks, each containing 2-3 sentences
     """
-    # Split by sentence-ending punctuation while keeping the punctuation
-    # This regex splits on . ! or ? followed by whitespace or end of string
-    sentence_pattern = r'(?<=[.!?])\s+'
-    sentences = re.split(sentence_pattern, transcript.strip())
-    
-    # Filter out empty strings
-    sentences = [s.strip() for s in sentences if s.strip()]
-    
-    chunks = []
-    i = 0
-    
-    while i < len(sentences):
-        # Take 2-3 sentences per chunk
-        # Prefer 3 sentences, but take 2 if that's what's left
-        if i + 3 <= len(sentences):
-            chunk = ' '.join(sentences[i:i+3])
-            i += 3
-        elif i + 2 <= len(sentences):
-            chunk = ' '.join(sentences[i:i+2])
-            i += 2
-        else:
-            # Only one sentence left
-            chunk = sentences[i]
-            i += 1
-        
-        chunks.append(chunk)
-    
-    return chunks
+    return list(iter_chunks(transcript))
 
 
-def pass_chunk(chunk: str, current_state: dict, chunk_index: int = 0) -> dict:
+def iter_chunks(transcript: str) -> Iterator[str]:
     """
-    Passes a chunk and the currentState as context to GPT.
-    The model returns an updated version of the currentState.
+    Yields the chunks of chunk_transcript one at a time, without building
+    the list of sentences or chunks first.
     
     Args:
-        chunk: The text chunk to process
-        current_state: The current state dictionary containing:
-            - meetingSummary (str): Summary of the meeting so far
-            - workflows (list): List of workflow dicts with mermaidDiagram and sources
-            - version (int): Current version number
-        chunk_index: The index of this chunk (for source tracking)
+        transcript: The full transcript string to chunk
     
-    Returns:
-        dict: Updated currentState with incremented version
+    Yields:
+        str: Chunks of 3 sentences; the last one gets the 1-2 left over
     """
-    system_prompt = """You are an AI assistant that processes meeting transcripts to extract insights.
+    text = transcript.strip()
+    sentences = []
+    start = 0
+    # SENTENCE_BOUNDARY matches the whitespace after . ! or ?, so each
+    # sentence keeps its punctuation
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        if sentence := text[start:boundary.start()].strip():
+            sentences.append(sentence)
+            if len(sentences) == 3:
+                yield ' '.join(sentences)
+                sentences = []
+        start = boundary.end()
+    if sentence := text[start:].strip():
+        sentences.append(sentence)
+    if sentences:
+        yield ' '.join(sentences)
+
+
+# Both system prompts are fixed strings that carry all of the instructions,
+# and the user messages hold only the per-call state and chunks. Every
+# request therefore starts with the same long prefix, which OpenAI's
+# automatic prompt caching can reuse across calls.
+
+STATE_JSON_FORMAT = """{
+        "meetingSummary": "summary incorporating all information so far",
+        "workflows": [
+            {
+                "mermaidDiagram": "flowchart TD\\n    A[Start] --> B[Step]\\n    B --> C[End]",
+                "sources": ["chunk_0", "chunk_1"]
+            }
+        ]
+    }"""
+
+CHUNK_SYSTEM_PROMPT = f"""You are an AI assistant that processes meeting transcripts to extract insights.
     Your job is to:
-    1. Update the meeting summary with key points from the new chunk
+    1. Update the meeting summary with key points from the new chunks
     2. Identify any workflows or processes mentioned and create/update Mermaid diagrams for them
 
-    You will receive the current state and a new chunk of transcript.
+    You will receive the current state and one or more new chunks of transcript, in order.
     Return an updated state in the exact JSON format specified.
 
     For workflows:
     - Create a new workflow if a distinct process/workflow is described
-    - Update existing workflows if the chunk adds to them
+    - Update existing workflows if the chunks add to them
     - Use valid Mermaid diagram syntax (flowchart TD format)
     - Track which chunks contributed to each workflow in the sources array
 
     Important:
     - Keep the meeting summary concise but comprehensive
     - Only create workflows for actual processes/procedures described
-    - Each workflow should have a descriptive mermaid diagram"""
+    - Each workflow should have a descriptive mermaid diagram
 
-    user_prompt = f"""Current State:
-    {json.dumps(current_state, indent=2)}
+    The response must be valid JSON with this exact structure:
+    {STATE_JSON_FORMAT}
 
-    New Chunk (index {chunk_index}):
-    "{chunk}"
+    Return ONLY the JSON object, no additional text."""
 
-    Please analyze this chunk and return an updated state. The response must be valid JSON with this exact structure:
-    {{
-        "meetingSummary": "updated summary incorporating new information",
-        "workflows": [
-            {{
-                "mermaidDiagram": "flowchart TD\\n    A[Start] --> B[Step]\\n    B --> C[End]",
-                "sources": ["chunk_0", "chunk_1"]
-            }}
-        ],
-        "version": {current_state.get('version', 0) + 1}
-    }}
+MERGE_SYSTEM_PROMPT = f"""You are an AI assistant that combines insights extracted from consecutive parts of one meeting transcript.
+    You will receive a list of partial states, in transcript order, each built from consecutive chunks.
+    Merge them into a single state in the exact JSON format specified:
+    - Write one concise but comprehensive meeting summary covering every partial summary
+    - Merge workflows that describe the same process into one Mermaid diagram (flowchart TD format)
+    - Keep genuinely distinct workflows separate
+    - Combine the sources arrays of merged workflows
+
+    The response must be valid JSON with this exact structure:
+    {STATE_JSON_FORMAT}
 
     Return ONLY the JSON object, no additional text."""
 
+
+def build_chunk_messages(chunks: list[tuple[int, str]], current_state: dict) -> list[dict]:
+    """
+    Builds the chat messages asking GPT to update current_state with chunks.
+    
+    Args:
+        chunks: (chunk index, chunk text) pairs, in transcript order
+        current_state: The current state dictionary
+    
+    Returns:
+        list: System and user messages for chat.completions.create
+    """
+    # The model only sees the content it updates; version is kept by the caller
+    state_content = {
+        "meetingSummary": current_state.get("meetingSummary", ""),
+        "workflows": current_state.get("workflows", []),
+    }
+    new_chunks = [{"index": chunk_index, "text": chunk} for chunk_index, chunk in chunks]
+    user_prompt = f"""Current State:
+    {orjson.dumps(state_content).decode()}
+
+    New Chunks:
+    {orjson.dumps(new_chunks).decode()}"""
+
+    return [
+        {"role": "system", "content": CHUNK_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def build_merge_messages(states: list[dict]) -> list[dict]:
+    """
+    Builds the chat messages asking GPT to merge per-chunk states into one.
+    
+    Args:
+        states: Partial states, in transcript order
+    
+    Returns:
+        list: System and user messages for chat.completions.create
+    """
+    partial_states = [
+        {"meetingSummary": state.get("meetingSummary", ""), "workflows": state.get("workflows", [])}
+        for state in states
+    ]
+    user_prompt = f"""Partial States:
+    {orjson.dumps(partial_states).decode()}"""
+
+    return [
+        {"role": "system", "content": MERGE_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def _classify_chunk_complexity(text: str) -> str:
+    """
+    Classifies transcript text as "simple" (short, no process language) or "complex".
+    
+    Args:
+        text: One chunk, or the joined chunks of a batch
+    
+    Returns:
+        str: "simple" or "complex"
+    """
+    if len(text) < SIMPLE_CHUNK_MAX_CHARS and not PROCESS_LANGUAGE.search(text):
+        return "simple"
+    return "complex"
+
+
+def chunk_model(chunks: list[tuple[int, str]]) -> str:
+    """Picks the model for a chunk request from the complexity of its text."""
+    text = " ".join(chunk for _, chunk in chunks)
+    if _classify_chunk_complexity(text) == "simple":
+        return SIMPLE_CHUNK_MODEL
+    return COMPLETION_PARAMS["model"]
+
+
+# Complete responses by request key, so re-running a transcript (same
+# chunks, same state) skips the API
+_response_cache: dict[str, str] = {}
+_disk_cache: sqlite3.Connection | None = None
+_disk_cache_lock = threading.Lock()
+
+
+def enable_disk_cache(path: Path = RESPONSE_CACHE_PATH):
+    """Also keep cached responses in a SQLite file, so they survive across runs."""
+    global _disk_cache
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Shared by the thread-pool workers; _disk_cache_lock serializes access
+    _disk_cache = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    _disk_cache.execute('''
+        CREATE TABLE IF NOT EXISTS response_cache (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL
+        )
+    ''')
+
+
+def completion_request(messages: list[dict], model: str | None = None) -> dict:
+    """The chat.completions.create() body for messages, minus stream."""
+    return {**COMPLETION_PARAMS, "model": model or COMPLETION_PARAMS["model"], "messages": messages}
+
+
+def response_cache_key(request: dict) -> str:
+    """Key a completion_request() body; it covers the model, prompt, state and chunks."""
+    return hashlib.blake2b(orjson.dumps(request, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
+def cache_get(key: str) -> str | None:
+    """Cached response text for a response_cache_key(), or None."""
+    content = _response_cache.get(key)
+    if content is None and _disk_cache is not None:
+        with _disk_cache_lock:
+            row = _disk_cache.execute(
+                'SELECT response FROM response_cache WHERE key = ?', (key,)
+            ).fetchone()
+        if row:
+            content = _response_cache[key] = row[0]
+    return content
+
+
+def cache_put(key: str, content: str):
+    """Store the response text for a response_cache_key()."""
+    _response_cache[key] = content
+    if _disk_cache is not None:
+        with _disk_cache_lock:
+            _disk_cache.execute(
+                'INSERT OR REPLACE INTO response_cache (key, response) VALUES (?, ?)',
+                (key, content)
+            )
+
+
+class TruncatedResponseError(RuntimeError):
+    """The model hit max_completion_tokens before finishing its JSON."""
+
+
+def check_finish_reason(finish_reason: str | None):
+    """Raises TruncatedResponseError for a response cut off by the output cap."""
+    if finish_reason == "length":
+        raise TruncatedResponseError(
+            f"response cut off at max_completion_tokens={COMPLETION_PARAMS['max_completion_tokens']}"
+        )
+
+
+class CompletionStream:
+    """
+    Collects one streamed completion: the text, its finish reason and the
+    cache write, shared by the sync and async transports.
+    """
+    
+    def __init__(self, key: str, on_delta=None):
+        self.key = key
+        self.on_delta = on_delta
+        self.parts = []
+        self.finish_reason = None
+    
+    def add(self, event):
+        if not event.choices:
+            return
+        self.finish_reason = event.choices[0].finish_reason or self.finish_reason
+        delta = event.choices[0].delta.content
+        if delta:
+            self.parts.append(delta)
+            if self.on_delta:
+                self.on_delta(delta)
+    
+    def result(self) -> str:
+        content = "".join(self.parts)
+        check_finish_reason(self.finish_reason)
+        if self.finish_reason == "stop":
+            cache_put(self.key, content)
+        return content
+
+
+def prepare_completion(messages: list[dict], on_delta=None, model: str | None = None):
+    """
+    Returns (request, stream, None) for a request that must be sent, or
+    (None, None, content) when an identical earlier request's response is cached.
+    """
+    request = completion_request(messages, model)
+    key = response_cache_key(request)
+    content = cache_get(key)
+    if content is not None:
+        if on_delta:
+            on_delta(content)
+        return None, None, content
+    return request, CompletionStream(key, on_delta), None
+
+
+def complete_json(messages: list[dict], on_delta=None, model: str | None = None) -> str:
+    """
+    Streams a JSON-mode completion and returns the full response text.
+    An identical earlier request's response is returned from the cache.
+    
+    Args:
+        messages: Chat messages to send
+        on_delta: Optional callback given each piece of text as it arrives
+        model: Model to use instead of the COMPLETION_PARAMS default
+    
+    Returns:
+        str: The concatenated response text
+    """
+    request, stream, content = prepare_completion(messages, on_delta, model)
+    if request is None:
+        return content
+    for event in client.chat.completions.create(stream=True, **request):
+        stream.add(event)
+    return stream.result()
+
+
+async def complete_json_async(
+    aclient: AsyncOpenAI,
+    messages: list[dict],
+    on_delta=None,
+    model: str | None = None
+) -> str:
+    """Async version of complete_json, on aclient."""
+    request, stream, content = prepare_completion(messages, on_delta, model)
+    if request is None:
+        return content
+    async for event in await aclient.chat.completions.create(stream=True, **request):
+        stream.add(event)
+    return stream.result()
+
+
+def print_delta(delta: str):
+    """Prints streamed text as it arrives."""
+    print(delta, end="", flush=True)
+
+
+def advance_state(current_state: dict, chunk_count: int) -> dict:
+    """
+    Returns current_state's content as a new state, its version advanced past
+    chunk_count chunks. Used when chunks could not be processed; the
+    workflows list is shared rather than copied, since nothing mutates it.
+    """
+    return {
+        "meetingSummary": current_state.get("meetingSummary", ""),
+        "workflows": current_state.get("workflows", []),
+        "version": current_state.get("version", 0) + chunk_count
+    }
+
+
+def parse_chunk_state(content: str, current_state: dict, chunk_count: int) -> dict:
+    """The state in a chunk response, its version advanced past chunk_count chunks."""
+    result = orjson.loads(content)
+    result['version'] = current_state.get('version', 0) + chunk_count
+    return result
+
+
+def split_batch(chunks: list[tuple[int, str]]) -> list[list[tuple[int, str]]]:
+    """Halves of a batch whose response was cut off, retried as separate requests."""
+    middle = len(chunks) // 2
+    return [chunks[:middle], chunks[middle:]]
+
+
+def rejoin_split_state(merged_state: dict, current_state: dict, chunk_count: int) -> dict:
+    """
+    Gives the merge of a split batch's halves the version of the unsplit batch;
+    each half started from current_state, so merge_states would count it twice.
+    """
+    merged_state["version"] = current_state.get("version", 0) + chunk_count
+    return merged_state
+
+
+def chunk_fallback(where: str, error: Exception, current_state: dict, chunk_count: int) -> dict:
+    """On error, return current state with its version advanced past the chunks."""
+    print(f"Error in {where}: {error}")
+    return advance_state(current_state, chunk_count)
+
+
+def pass_chunk(chunk: str, current_state: dict, chunk_index: int = 0) -> dict:
+    """
+    Passes a chunk and the currentState as context to GPT.
+    The model returns an updated version of the currentState.
+    
+    Args:
+        chunk: The text chunk to process
+        current_state: The current state dictionary containing:
+            - meetingSummary (str): Summary of the meeting so far
+            - workflows (list): List of workflow dicts with mermaidDiagram and sources
+            - version (int): Current version number
+        chunk_index: The index of this chunk (for source tracking)
+    
+    Returns:
+        dict: Updated currentState with incremented version
+    """
+    return pass_chunks_sync([(chunk_index, chunk)], current_state)
+
+
+async def pass_chunks_batched(
+    aclient: AsyncOpenAI,
+    chunks: list[tuple[int, str]],
+    current_state: dict,
+    on_delta=None
+) -> dict:
+    """
+    Passes several chunks and the currentState to GPT in a single request,
+    so the prompt and state are sent once for the whole batch.
+    
+    Args:
+        aclient: AsyncOpenAI client for this run
+        chunks: (chunk index, chunk text) pairs, in transcript order
+        current_state: The current state dictionary
+        on_delta: Optional callback given the response text as it streams in
+    
+    Returns:
+        dict: Updated currentState, its version advanced by one per chunk
+    
+    A response cut off by the output cap is retried as two half batches
+    whose states are then merged, so no chunk is dropped for being batched.
+    """
     try:
-        response = client.chat.completions.create(
-            model="gpt-5.2",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
+        content = await complete_json_async(
+            aclient, build_chunk_messages(chunks, current_state), on_delta, chunk_model(chunks)
         )
-        
-        result = json.loads(response.choices[0].message.content)
-        result['version'] = current_state.get('version', 0) + 1
-        
-        return result
-        
+        return parse_chunk_state(content, current_state, len(chunks))
+    except TruncatedResponseError as e:
+        if len(chunks) == 1:
+            return chunk_fallback("pass_chunks_batched", e, current_state, 1)
+        print(f"\n✂️  Response for {len(chunks)} chunks was cut off; splitting the batch")
+        states = await asyncio.gather(
+            *(pass_chunks_batched(aclient, half, current_state) for half in split_batch(chunks))
+        )
+        return rejoin_split_state(await merge_states(aclient, states), current_state, len(chunks))
     except Exception as e:
-        # On error, return current state with incremented version
-        print(f"Error in pass_chunk: {e}")
-        new_state = current_state.copy()
-        new_state['version'] = current_state.get('version', 0) + 1
-        return new_state
+        return chunk_fallback("pass_chunks_batched", e, current_state, len(chunks))
+
+
+def pass_chunks_sync(chunks: list[tuple[int, str]], current_state: dict) -> dict:
+    """Sync version of pass_chunks_batched, on the module-level client."""
+    try:
+        content = complete_json(build_chunk_messages(chunks, current_state), model=chunk_model(chunks))
+        return parse_chunk_state(content, current_state, len(chunks))
+    except TruncatedResponseError as e:
+        if len(chunks) == 1:
+            return chunk_fallback("pass_chunks_sync", e, current_state, 1)
+        print(f"\n✂️  Response for {len(chunks)} chunks was cut off; splitting the batch")
+        states = [pass_chunks_sync(half, current_state) for half in split_batch(chunks)]
+        return rejoin_split_state(merge_states_sync(states), current_state, len(chunks))
+    except Exception as e:
+        return chunk_fallback("pass_chunks_sync", e, current_state, len(chunks))
+
+
+def parse_merged_state(content: str, states: list[dict]) -> dict:
+    """The state in a merge response, its version the total of the partial versions."""
+    merged_state = orjson.loads(content)
+    merged_state["version"] = sum(state.get("version", 0) for state in states)
+    return merged_state
+
+
+def merge_fallback(where: str, error: Exception, states: list[dict]) -> dict:
+    """On error, fall back to concatenating the partial states."""
+    print(f"Error in {where}: {error}")
+    merged_state = concatenate_states(states)
+    merged_state["version"] = sum(state.get("version", 0) for state in states)
+    return merged_state
+
+
+async def merge_states(aclient: AsyncOpenAI, states: list[dict], on_delta=None) -> dict:
+    """
+    Merges per-batch states into the state for the whole transcript.
+    
+    Args:
+        aclient: AsyncOpenAI client for this run
+        states: Partial states, in transcript order
+        on_delta: Optional callback given the response text as it streams in
+    
+    Returns:
+        dict: Merged state whose version is the total of the partial versions
+    """
+    if len(states) == 1:
+        return states[0]
+    
+    try:
+        content = await complete_json_async(aclient, build_merge_messages(states), on_delta)
+        return parse_merged_state(content, states)
+    except Exception as e:
+        return merge_fallback("merge_states", e, states)
+
+
+def merge_states_sync(states: list[dict], on_delta=None) -> dict:
+    """Sync version of merge_states, on the module-level client."""
+    if len(states) == 1:
+        return states[0]
+    
+    try:
+        content = complete_json(build_merge_messages(states), on_delta)
+        return parse_merged_state(content, states)
+    except Exception as e:
+        return merge_fallback("merge_states_sync", e, states)
+
+
+def concatenate_states(states: list[dict]) -> dict:
+    """Joins partial states without the model: summaries in order, all workflows."""
+    return {
+        "meetingSummary": "\n".join(
+            state["meetingSummary"] for state in states if state.get("meetingSummary")
+        ),
+        "workflows": [wf for state in states for wf in state.get("workflows", [])],
+    }
 
 
 def process_with_llm(current_state_data: dict, chunk: str) -> dict:
@@ -182,7 +644,13 @@ def process_with_llm(current_state_data: dict, chunk: str) -> dict:
 
 def process_full_transcript(transcript: str, verbose: bool = True) -> dict:
     """
-    Process a full transcript by chunking it and processing each chunk.
+    Process a full transcript by chunking it and processing the chunks.
+    
+    Chunks are sent in batches of up to CHUNK_BATCH_CHARS characters, so a
+    typical transcript takes a single request. Longer transcripts have
+    their batches processed concurrently (CHUNK_CONCURRENCY at a time),
+    each against the initial state, and the batch states are then merged
+    into one with a single extra call.
     
     Args:
         transcript: The full transcript string
@@ -191,26 +659,220 @@ def process_full_transcript(transcript: str, verbose: bool = True) -> dict:
     Returns:
         Final state after processing all chunks
     """
-    chunks = chunk_transcript(transcript)
-    current_state = get_initial_state()
+    batches = batch_chunks(iter_chunks(transcript))
     
     if verbose:
-        print(f"\n📝 Transcript chunked into {len(chunks)} chunks\n")
+        print(f"\n📝 Transcript chunked into {count_chunks(batches)} chunks\n")
         print("=" * 60)
     
-    for i, chunk in enumerate[str](chunks):
-        if verbose:
-            print(f"\n🔄 Processing chunk {i + 1}/{len(chunks)}...")
-            print(f"   Chunk: \"{chunk[:80]}{'...' if len(chunk) > 80 else ''}\"")
-        
-        current_state = pass_chunk(chunk, current_state, i)
+    if not batches:
+        return get_initial_state()
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_process_chunks(batches, verbose))
+    # Already inside an event loop (e.g. a notebook), where asyncio.run
+    # is unavailable: make the same calls from a thread pool instead
+    return _process_chunks_threaded(batches, verbose)
+
+
+def batch_chunks(chunks: Iterable[str]) -> list[list[tuple[int, str]]]:
+    """
+    Groups chunks into consecutive batches of up to CHUNK_BATCH_CHARS characters.
+    
+    Args:
+        chunks: Transcript chunks, in order
+    
+    Returns:
+        list: Batches of (chunk index, chunk text) pairs
+    """
+    batches = []
+    batch = []
+    batch_chars = 0
+    for i, chunk in enumerate(chunks):
+        if batch and batch_chars + len(chunk) > CHUNK_BATCH_CHARS:
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append((i, chunk))
+        batch_chars += len(chunk)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def count_chunks(batches: list[list[tuple[int, str]]]) -> int:
+    """Returns the number of chunks in the output of batch_chunks."""
+    return batches[-1][-1][0] + 1 if batches else 0
+
+
+async def _process_chunks(batches: list[list[tuple[int, str]]], verbose: bool) -> dict:
+    """Process chunk batches concurrently, then merge their states in transcript order."""
+    async with make_async_client() as aclient:
+        return await _process_batches(aclient, batches, verbose)
+
+
+async def _process_batches(aclient: AsyncOpenAI, batches: list[list[tuple[int, str]]], verbose: bool) -> dict:
+    """Body of _process_chunks, on aclient."""
+    semaphore = asyncio.Semaphore(CHUNK_CONCURRENCY)
+    initial_state = get_initial_state()
+    chunk_count = count_chunks(batches)
+    
+    async def process_batch(b: int, batch: list[tuple[int, str]]) -> dict:
+        async with semaphore:
+            if verbose:
+                print(f"\n🔄 Processing batch {b + 1}/{len(batches)} "
+                      f"(chunks {batch[0][0] + 1}-{batch[-1][0] + 1} of {chunk_count})...")
+            
+            # A lone batch is the final answer, so show it as it streams
+            on_delta = print_delta if verbose and len(batches) == 1 else None
+            state = await pass_chunks_batched(aclient, batch, initial_state, on_delta)
         
         if verbose:
-            print(f"   ✅ Version updated to {current_state['version']}")
-            print(f"   📄 Summary length: {len(current_state.get('meetingSummary', ''))} chars")
-            print(f"   🔀 Workflows: {len(current_state.get('workflows', []))}")
+            print(f"\n   ✅ Batch {b + 1} processed")
+            print(f"   📄 Summary length: {len(state.get('meetingSummary', ''))} chars")
+            print(f"   🔀 Workflows: {len(state.get('workflows', []))}")
+        return state
+    
+    states = await asyncio.gather(*(process_batch(b, batch) for b, batch in enumerate(batches)))
+    
+    if verbose and len(states) > 1:
+        print(f"\n🧩 Merging {len(states)} batch states...\n")
+    
+    return await merge_states(aclient, states, print_delta if verbose else None)
+
+
+def _process_chunks_threaded(batches: list[list[tuple[int, str]]], verbose: bool) -> dict:
+    """Thread-pool version of _process_chunks, on the module-level client."""
+    initial_state = get_initial_state()
+    
+    states = [None] * len(batches)
+    with ThreadPoolExecutor(max_workers=min(CHUNK_CONCURRENCY, len(batches))) as executor:
+        futures = {
+            executor.submit(pass_chunks_sync, batch, initial_state): b
+            for b, batch in enumerate(batches)
+        }
+        for future in as_completed(futures):
+            b = futures[future]
+            states[b] = future.result()
+            if verbose:
+                print(f"\n   ✅ Batch {b + 1}/{len(batches)} processed")
+    
+    if verbose and len(states) > 1:
+        print(f"\n🧩 Merging {len(states)} batch states...\n")
+    
+    return merge_states_sync(states, print_delta if verbose else None)
+
+
+def run_chunk_batch(requests: dict[str, list[dict]], verbose: bool = True) -> dict[str, str]:
+    """
+    Runs chat completions through the OpenAI Batch API and waits for them.
+    Half the price of real-time requests, with up to 24h turnaround.
+    
+    Args:
+        requests: custom_id -> chat messages
+        verbose: Whether to print progress updates
+    
+    Returns:
+        dict: custom_id -> response content, for the requests that succeeded
+    """
+    import io
+    
+    lines = [
+        orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"messages": messages, **COMPLETION_PARAMS}
+        })
+        for custom_id, messages in requests.items()
+    ]
+    batch_file = client.files.create(
+        file=("chunk_batch.jsonl", io.BytesIO(b"\n".join(lines))),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    if verbose:
+        print(f"\n⏳ Submitted batch {batch.id} ({len(requests)} requests)")
     
-    return current_state
+    poll_seconds = BATCH_POLL_MIN_SECONDS
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_seconds)
+        poll_seconds = min(poll_seconds * 2, BATCH_POLL_MAX_SECONDS)
+        batch = client.batches.retrieve(batch.id)
+        if verbose and batch.request_counts:
+            counts = batch.request_counts
+            print(f"   {batch.status}: {counts.completed}/{counts.total} done, {counts.failed} failed")
+    
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+    
+    results = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                choice = response["body"]["choices"][0]
+                if choice.get("finish_reason") == "length":
+                    print(f"Error in run_chunk_batch: {item['custom_id']} cut off at max_completion_tokens")
+                    continue
+                results[item["custom_id"]] = choice["message"]["content"]
+    return results
+
+
+def process_full_transcript_batch(transcript: str, verbose: bool = True) -> dict:
+    """
+    Process a full transcript like process_full_transcript, but submit the
+    chunk batches through the OpenAI Batch API. For offline runs where cost
+    matters more than latency; the final merge is a normal request.
+    
+    Args:
+        transcript: The full transcript string
+        verbose: Whether to print progress updates
+    
+    Returns:
+        Final state after processing all chunks
+    """
+    batches = batch_chunks(iter_chunks(transcript))
+    
+    if verbose:
+        print(f"\n📝 Transcript chunked into {count_chunks(batches)} chunks\n")
+        print("=" * 60)
+    
+    if not batches:
+        return get_initial_state()
+    
+    initial_state = get_initial_state()
+    results = run_chunk_batch({
+        f"batch-{b}": build_chunk_messages(batch, initial_state)
+        for b, batch in enumerate(batches)
+    }, verbose)
+    
+    async def finish() -> dict:
+        async with make_async_client() as aclient:
+            async def batch_state(b: int, batch: list[tuple[int, str]]) -> dict:
+                content = results.get(f"batch-{b}")
+                if content is not None:
+                    return parse_chunk_state(content, initial_state, len(batch))
+                # Failed or cut-off request: retry it as a normal request, which
+                # splits a batch whose response does not fit the output cap
+                print(f"Error in process_full_transcript_batch: no result for batch {b + 1}, retrying")
+                return await pass_chunks_batched(aclient, batch, initial_state)
+            
+            states = await asyncio.gather(*(batch_state(b, batch) for b, batch in enumerate(batches)))
+            
+            if verbose and len(states) > 1:
+                print(f"\n🧩 Merging {len(states)} batch states...\n")
+            
+            return await merge_states(aclient, states, print_delta if verbose else None)
+    
+    return asyncio.run(finish())
 
 
 # ==================== TEST HARNESS ====================
@@ -306,13 +968,58 @@ Great. I'll document this workflow and share it after the meeting.
 """
 
 
+def check_models() -> bool:
+    """
+    Sends one tiny chunk request to each model chunk requests are routed to,
+    with the same parameters, and reports whether it was accepted.
+    
+    Returns:
+        bool: True if every model answered with complete, parseable JSON
+    """
+    messages = build_chunk_messages([(0, "Same for design.")], get_initial_state())
+    all_ok = True
+    for model in (COMPLETION_PARAMS["model"], SIMPLE_CHUNK_MODEL):
+        try:
+            response = client.chat.completions.create(**completion_request(messages, model))
+            choice = response.choices[0]
+            orjson.loads(choice.message.content)
+            ok = choice.finish_reason == "stop"
+            detail = f"finish_reason={choice.finish_reason}"
+        except Exception as e:
+            ok = False
+            detail = str(e)
+        all_ok &= ok
+        print(f"{'✅' if ok else '❌'} {model}: {detail}")
+    return all_ok
+
+
 def main():
     """Main entry point for testing."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Process a transcript without the API server")
+    parser.add_argument("transcript", nargs="?", help="Transcript to process (default: sample transcript)")
+    parser.add_argument("--batch", action="store_true", help="Use the OpenAI Batch API (half price, up to 24h)")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"Reuse responses across runs via {RESPONSE_CACHE_PATH.name}")
+    parser.add_argument("--check-models", action="store_true",
+                        help="Only check that every routed model accepts the chunk request parameters")
+    args = parser.parse_args()
+    
+    if args.check_models:
+        sys.exit(0 if check_models() else 1)
+    
+    if args.cache:
+        enable_disk_cache()
+    
     # Get transcript from command line arg or use sample
-    transcript = SAMPLE_TRANSCRIPT
+    transcript = args.transcript or SAMPLE_TRANSCRIPT
     
     # Process the transcript
-    final_state = process_full_transcript(transcript)
+    if args.batch:
+        final_state = process_full_transcript_batch(transcript)
+    else:
+        final_state = process_full_transcript(transcript)
     
     # Print results
     print("\n" + "=" * 60)
@@ -86,7 +86,7 @@ export interface CreateMeetingResponse {
 }
 
 export interface SSEMessage {
-  type: "connected" | "processing_started" | "chunk_processed" | "processing_complete" | "keepalive";
+  type: "connected" | "processing_started" | "chunk_processed" | "processing_complete";
   meetingId?: string;
   chunkIndex?: number;
   totalChunks?: number;
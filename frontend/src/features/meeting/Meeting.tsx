@@ -720,9 +720,6 @@ export function Meeting() {
               }
             }
             break;
-          
-          case "keepalive":
-            break;
         }
       },
       (error) => {
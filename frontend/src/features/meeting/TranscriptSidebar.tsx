@@ -35,8 +35,8 @@ export function TranscriptSidebar({
     }
   }, [processingChunkIndex, isProcessing]);
 
-  // Generate chunks list - versions start at 0 (initial state), then 1 for chunk 0, etc.
-  // So version N corresponds to chunk N-1
+  // Generate chunks list - each chunk is matched to the version that carries its chunkIndex.
+  // Live meetings also have an empty version 0; seeded meetings start at version 1
   const chunks = Array.from({ length: totalChunks }, (_, i) => {
     // Find the version that processed this chunk
     const version = versions.find(v => v.chunkIndex === i);
@@ -59,7 +59,7 @@ export function TranscriptSidebar({
           </div>
         )}
         {!isProcessing && totalChunks > 0 && (
-          <span className="chunk-count">{versions.length - 1}/{totalChunks} chunks</span>
+          <span className="chunk-count">{chunks.filter(c => c.isProcessed).length}/{totalChunks} chunks</span>
         )}
       </div>
 
@@ -221,13 +221,25 @@ function getCurrentState(): CurrentState {
   };
 }
 
-function broadcastState() {
-  const event: SocketEvent = {
-    type: "full_state",
-    state: getCurrentState(),
-  };
+// Serialized full_state event for the current stage, built once per stage
+// and shared by the broadcast and every client that connects during it
+let cachedStage = -1;
+let cachedMessage = "";
 
-  const message = JSON.stringify(event);
+function getCurrentMessage(): string {
+  if (cachedStage !== stageIndex) {
+    const event: SocketEvent = {
+      type: "full_state",
+      state: getCurrentState(),
+    };
+    cachedMessage = JSON.stringify(event);
+    cachedStage = stageIndex;
+  }
+  return cachedMessage;
+}
+
+function broadcastState() {
+  const message = getCurrentMessage();
 
   for (const client of clients) {
     if (client.readyState === WebSocket.OPEN) {
@@ -252,11 +264,7 @@ wss.on("connection", (ws, req) => {
   clients.add(ws);
 
   // Send current state immediately on connect
-  const event: SocketEvent = {
-    type: "full_state",
-    state: getCurrentState(),
-  };
-  ws.send(JSON.stringify(event));
+  ws.send(getCurrentMessage());
 
   ws.on("close", () => {
     console.log(`[-] Client disconnected: ${url}`);